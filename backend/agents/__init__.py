@@ -17,14 +17,7 @@ Usage:
     learning_path = await runner.create_learning_path(topic="Python programming")
 """
 
-from backend.agents.agents import (
-    user_profiler_agent,
-    curriculum_agent,
-    scheduler_agent,
-    assessment_agent,
-    resource_finder_agent,
-    studysync_orchestrator,
-)
+from backend.agents import agents as _agents
 from backend.agents.runner import LearningPathRunner
 
 # Also export commonly used tools for direct access
@@ -33,7 +26,9 @@ from backend.agents.tools import (
     generate_curriculum,
     create_study_schedule,
     generate_module_quiz,
+    generate_module_quizzes_batch,
     evaluate_quiz_responses,
+    evaluate_quiz_batch,
     generate_proficiency_assessment,
     find_session_resources,
 )
@@ -53,7 +48,16 @@ __all__ = [
     "generate_curriculum",
     "create_study_schedule",
     "generate_module_quiz",
+    "generate_module_quizzes_batch",
     "evaluate_quiz_responses",
+    "evaluate_quiz_batch",
     "generate_proficiency_assessment",
     "find_session_resources",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve agent names lazily so importing the package doesn't build them."""
+    if name in _agents._AGENT_BUILDERS:
+        return _agents.get_agent(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
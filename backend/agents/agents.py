@@ -8,10 +8,18 @@ Architecture:
     ├── user_profiler_agent (tools: assess_proficiency, analyze_calendar, determine_commitment)
     ├── curriculum_agent (tools: generate_curriculum, get_module_resources, generate_study_guide)
     ├── scheduler_agent (tools: create_study_schedule)
-    ├── assessment_agent (tools: generate_module_quiz, evaluate_quiz_responses, generate_proficiency_assessment)
+    ├── assessment_agent (tools: generate_module_quiz, generate_module_quizzes_batch, evaluate_quiz_responses, generate_proficiency_assessment)
     └── resource_finder_agent (tools: search_youtube, search_web, browse_url, filter_resources_by_quality)
+
+Agents are built on first use (get_agent, or attribute access such as
+``from backend.agents.agents import curriculum_agent``) and cached, so code
+paths that only call tools never construct them.
 """
 
+from functools import lru_cache
+from typing import Dict
+import threading
+
 from google.adk.agents import Agent
 from google.adk.models.lite_llm import LiteLlm
 
@@ -35,6 +43,7 @@ from backend.agents.tools import (
     create_study_schedule,
     # Assessment tools
     generate_module_quiz,
+    generate_module_quizzes_batch,
     evaluate_quiz_responses,
     generate_proficiency_assessment,
     # Resource tools (modular)
@@ -52,17 +61,24 @@ MODEL_SMART = "openai/gpt-4.1"  # For complex reasoning tasks
 MODEL_FAST = "openai/gpt-4.1"   # For quick tasks (using same model for consistency)
 
 
+@lru_cache(maxsize=4)
+def _llm(model_name: str) -> LiteLlm:
+    """Get the shared LiteLlm wrapper for a model, so agents on the same model share one."""
+    return LiteLlm(model=model_name)
+
+
 # ============= Specialized Agents =============
 
-user_profiler_agent = Agent(
-    name="user_profiler_agent",
-    model=LiteLlm(model=MODEL_FAST),
-    description="""Analyzes user proficiency level and learning preferences.
+def _build_user_profiler_agent() -> Agent:
+    return Agent(
+        name="user_profiler_agent",
+        model=_llm(MODEL_FAST),
+        description="""Analyzes user proficiency level and learning preferences.
     Use this agent when you need to:
     - Assess a user's starting knowledge level for a topic
     - Determine their available time and commitment level
     - Analyze their calendar for study slot availability""",
-    instruction="""You are a learning assessment specialist for StudySync.
+        instruction="""You are a learning assessment specialist for StudySync.
 
 Your role is to build a complete user profile for learning path creation:
 
@@ -80,20 +96,21 @@ Your role is to build a complete user profile for learning path creation:
 
 Always provide clear reasoning for your assessments. The user profile you create
 will guide curriculum generation and scheduling.""",
-    tools=[
-        assess_proficiency,
-        analyze_calendar_availability,
-        determine_commitment_level,
-    ]
-)
-
-
-curriculum_agent = Agent(
-    name="curriculum_agent",
-    model=LiteLlm(model=MODEL_SMART),
-    description="""Generates personalized learning curricula with modules and topics.
+        tools=[
+            assess_proficiency,
+            analyze_calendar_availability,
+            determine_commitment_level,
+        ]
+    )
+
+
+def _build_curriculum_agent() -> Agent:
+    return Agent(
+        name="curriculum_agent",
+        model=_llm(MODEL_SMART),
+        description="""Generates personalized learning curricula with modules and topics.
     Use this agent to create structured learning paths tailored to the user's level.""",
-    instruction="""You are a curriculum design expert for StudySync.
+        instruction="""You are a curriculum design expert for StudySync.
 
 You have modular tools to build curricula iteratively or generate them all at once:
 
@@ -120,23 +137,24 @@ ADDITIONAL TOOLS:
 - generate_study_guide(module_title, subtopics) - Create study guides
 
 The curriculum you create forms the foundation for scheduling and assessment generation.""",
-    tools=[
-        analyze_topic_scope,
-        generate_module_outline,
-        estimate_curriculum_duration,
-        generate_curriculum,
-        get_module_resources,
-        generate_study_guide,
-    ]
-)
-
-
-scheduler_agent = Agent(
-    name="scheduler_agent",
-    model=LiteLlm(model=MODEL_FAST),
-    description="""Creates optimal study schedules based on curriculum and user availability.
+        tools=[
+            analyze_topic_scope,
+            generate_module_outline,
+            estimate_curriculum_duration,
+            generate_curriculum,
+            get_module_resources,
+            generate_study_guide,
+        ]
+    )
+
+
+def _build_scheduler_agent() -> Agent:
+    return Agent(
+        name="scheduler_agent",
+        model=_llm(MODEL_FAST),
+        description="""Creates optimal study schedules based on curriculum and user availability.
     Use this agent to schedule learning sessions across the user's available time.""",
-    instruction="""You are a study scheduling specialist for StudySync.
+        instruction="""You are a study scheduling specialist for StudySync.
 
 You have modular tools to build schedules iteratively or generate them all at once:
 
@@ -169,25 +187,27 @@ The schedule should:
 - Link sessions to their parent modules
 
 Each session will later receive resources from the resource finder agent.""",
-    tools=[
-        generate_time_slots,
-        schedule_session,
-        reschedule_session,
-        validate_schedule,
-        create_study_schedule,
-    ]
-)
-
-
-assessment_agent = Agent(
-    name="assessment_agent",
-    model=LiteLlm(model=MODEL_SMART),
-    description="""Generates quizzes and evaluates learning progress.
+        tools=[
+            generate_time_slots,
+            schedule_session,
+            reschedule_session,
+            validate_schedule,
+            create_study_schedule,
+        ]
+    )
+
+
+def _build_assessment_agent() -> Agent:
+    return Agent(
+        name="assessment_agent",
+        model=_llm(MODEL_SMART),
+        description="""Generates quizzes and evaluates learning progress.
     Use this agent for creating module assessments or evaluating quiz submissions.""",
-    instruction="""You are an assessment specialist for StudySync.
+        instruction="""You are an assessment specialist for StudySync.
 
 FOR QUIZ GENERATION:
-- Use generate_module_quiz for each curriculum module
+- Use generate_module_quizzes_batch to create quizzes for all curriculum modules in one call
+- Use generate_module_quiz only to (re)generate a single module's quiz
 - Questions should test key concepts from subtopics
 - Match difficulty to the user's proficiency level
 - Generate 5 questions per module by default
@@ -202,20 +222,22 @@ FOR EVALUATION:
 - Identify knowledge gaps for remediation
 
 Quality assessments help track learning progress and identify areas needing review.""",
-    tools=[
-        generate_module_quiz,
-        evaluate_quiz_responses,
-        generate_proficiency_assessment,
-    ]
-)
-
-
-resource_finder_agent = Agent(
-    name="resource_finder_agent",
-    model=LiteLlm(model=MODEL_FAST),
-    description="""Finds YouTube videos, articles, and documentation for study sessions.
+        tools=[
+            generate_module_quiz,
+            generate_module_quizzes_batch,
+            evaluate_quiz_responses,
+            generate_proficiency_assessment,
+        ]
+    )
+
+
+def _build_resource_finder_agent() -> Agent:
+    return Agent(
+        name="resource_finder_agent",
+        model=_llm(MODEL_FAST),
+        description="""Finds YouTube videos, articles, and documentation for study sessions.
     Use this agent to discover and curate high-quality learning resources.""",
-    instruction="""You are a learning resource curator for StudySync.
+        instruction="""You are a learning resource curator for StudySync.
 
 You have access to modular search tools to find the best resources for each topic:
 
@@ -263,24 +285,25 @@ TARGET: For each session, aim to find:
 - 1-2 quality articles or documentation pages
 
 Be iterative - if initial results are poor, try alternative search queries.""",
-    tools=[
-        search_youtube,
-        search_web,
-        browse_url,
-        filter_resources_by_quality,
-    ]
-)
+        tools=[
+            search_youtube,
+            search_web,
+            browse_url,
+            filter_resources_by_quality,
+        ]
+    )
 
 
 # ============= Root Orchestrator Agent =============
 
-studysync_orchestrator = Agent(
-    name="studysync_orchestrator",
-    model=LiteLlm(model=MODEL_SMART),
-    description="""Main coordinator for creating complete learning paths.
+def _build_studysync_orchestrator() -> Agent:
+    return Agent(
+        name="studysync_orchestrator",
+        model=_llm(MODEL_SMART),
+        description="""Main coordinator for creating complete learning paths.
     Delegates to specialized agents for profiling, curriculum, scheduling,
     assessment, and resource discovery.""",
-    instruction="""You are the main orchestrator for StudySync learning path creation.
+        instruction="""You are the main orchestrator for StudySync learning path creation.
 
 When asked to create a learning path, coordinate the following workflow:
 
@@ -308,11 +331,57 @@ When asked to create a learning path, coordinate the following workflow:
 Ensure all steps complete successfully before returning the final learning path.
 The complete learning path should include: user profile, curriculum, schedule,
 assessments, and resources for each session.""",
-    sub_agents=[
-        user_profiler_agent,
-        curriculum_agent,
-        scheduler_agent,
-        assessment_agent,
-        resource_finder_agent,
-    ]
-)
+        sub_agents=[
+            get_agent("user_profiler_agent"),
+            get_agent("curriculum_agent"),
+            get_agent("scheduler_agent"),
+            get_agent("assessment_agent"),
+            get_agent("resource_finder_agent"),
+        ]
+    )
+
+
+# ============= Agent Registry =============
+
+_AGENT_BUILDERS = {
+    "user_profiler_agent": _build_user_profiler_agent,
+    "curriculum_agent": _build_curriculum_agent,
+    "scheduler_agent": _build_scheduler_agent,
+    "assessment_agent": _build_assessment_agent,
+    "resource_finder_agent": _build_resource_finder_agent,
+    "studysync_orchestrator": _build_studysync_orchestrator,
+}
+
+
+_agents: Dict[str, Agent] = {}
+# Re-entrant: building the orchestrator gets its sub-agents through get_agent
+_agents_lock = threading.RLock()
+
+
+def get_agent(name: str) -> Agent:
+    """Get the shared agent instance for a name, building it on first use.
+
+    Each agent is built once: ADK agents can only belong to one parent, so
+    the orchestrator and direct callers must see the same sub-agent objects.
+    Safe to call from worker threads.
+    """
+    agent = _agents.get(name)
+    if agent is not None:
+        return agent
+
+    with _agents_lock:
+        agent = _agents.get(name)
+        if agent is None:
+            try:
+                builder = _AGENT_BUILDERS[name]
+            except KeyError:
+                raise ValueError(f"Unknown agent: {name}") from None
+            agent = _agents[name] = builder()
+        return agent
+
+
+def __getattr__(name: str):
+    """Build agents lazily on module attribute access (PEP 562)."""
+    if name in _AGENT_BUILDERS:
+        return get_agent(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
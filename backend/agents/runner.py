@@ -4,30 +4,116 @@ Provides two execution modes:
 1. Direct tool calling (fast, deterministic) - Default for API use
 2. Full ADK agent conversation (flexible, LLM-driven) - For complex scenarios
 
-The direct mode calls tool functions sequentially for predictable behavior,
-while the agent mode uses the orchestrator for flexible LLM-driven execution.
+The direct mode calls tool functions directly for predictable behavior (running
+independent phases concurrently), while the agent mode uses the orchestrator for flexible LLM-driven execution.
 """
 
 from typing import Dict, List, Optional, Callable, Awaitable, Any
+from itertools import chain, zip_longest
 import asyncio
+import logging
+import time
+import uuid
 
 from google.adk.sessions import InMemorySessionService
 from google.adk.runners import Runner
 from google.genai import types
 
-from backend.agents.agents import studysync_orchestrator
+from backend.agents.agents import get_agent
 from backend.agents.tools import (
     assess_proficiency,
-    determine_commitment_level,
+    generate_proficiency_assessment,
     generate_curriculum,
     create_study_schedule,
     generate_module_quiz,
+    evaluate_quiz_responses,
     find_session_resources,
+    _batched_module_quizzes,
+    _iter_session_specs,
+    _span_days,
+    COMMITMENT_CONFIG,
+    VALID_COMMITMENT_LEVELS,
+    VALID_PROFICIENCY_LEVELS,
 )
 
+logger = logging.getLogger(__name__)
+
 # Type for progress callback: async def callback(phase: str, message: str, data: dict = None)
 ProgressCallback = Callable[[str, str, Optional[Dict[str, Any]]], Awaitable[None]]
 
+# Commitment level used when the caller doesn't supply one
+_DEFAULT_COMMITMENT = "moderate"
+
+# Maximum number of module quizzes generated at the same time
+QUIZ_CONCURRENCY = 8
+
+# Maximum number of sessions searched for resources at the same time
+RESOURCE_CONCURRENCY = 8
+
+# Minimum seconds between per-session resource progress updates (the last one is always sent)
+PROGRESS_MIN_INTERVAL = 0.2
+
+# Progress phase reported for events emitted by each sub-agent (agent mode)
+AUTHOR_TO_PHASE = {
+    "user_profiler_agent": "profiling",
+    "curriculum_agent": "curriculum",
+    "scheduler_agent": "scheduling",
+    "resource_finder_agent": "resources",
+    "assessment_agent": "assessments",
+}
+
+
+class _ProgressRelay:
+    """Forwards progress updates to a callback from a background task.
+
+    Calling the relay only enqueues the update, so the caller never waits on
+    the callback's I/O. Updates are delivered one at a time in the order they
+    were sent, and a failing callback is logged instead of aborting the run.
+    """
+
+    def __init__(self, callback: ProgressCallback):
+        self._callback = callback
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def __call__(self, phase: str, message: str, data: Optional[Dict[str, Any]] = None) -> None:
+        self._queue.put_nowait((phase, message, data))
+        if self._task is None:
+            self._task = asyncio.create_task(self._deliver())
+
+    async def _deliver(self) -> None:
+        while True:
+            update = await self._queue.get()
+            if update is None:
+                return
+            try:
+                await self._callback(*update)
+            except Exception as e:
+                logger.warning("Progress callback failed: %s", e)
+
+    async def aclose(self) -> None:
+        """Wait until every queued update has been delivered."""
+        if self._task is not None:
+            self._queue.put_nowait(None)
+            await self._task
+
+
+def _session_topics(modules: List[Dict]) -> List[str]:
+    """List the session topics create_study_schedule produces, in session order."""
+    return [topic_title for _, topic_title, _, _ in _iter_session_specs(modules, 0)]
+
+
+def _interleaved_topics(modules: List[Dict]) -> List[str]:
+    """List session topics round-robin across modules (each module's 1st, then 2nd, ...).
+
+    Searching in this order covers every module early instead of working
+    through the curriculum one module at a time.
+    """
+    by_module: Dict[int, List[str]] = {}
+    for module, topic_title, _, _ in _iter_session_specs(modules, 0):
+        by_module.setdefault(id(module), []).append(topic_title)
+    return [t for t in chain.from_iterable(zip_longest(*by_module.values())) if t is not None]
+
 
 class LearningPathRunner:
     """Runner for creating learning paths using StudySync agents.
@@ -38,8 +124,24 @@ class LearningPathRunner:
     """
 
     def __init__(self):
-        """Initialize the runner with session service."""
+        """Initialize the runner with session service and ADK agent runner."""
         self.session_service = InMemorySessionService()
+        self._agent_runner: Optional[Runner] = None
+
+    @property
+    def agent_runner(self) -> Runner:
+        """ADK runner for agent mode, built on first use.
+
+        Reused by every agent-mode run (runs are isolated by session). Direct
+        mode never touches it, so the agents are only constructed when needed.
+        """
+        if self._agent_runner is None:
+            self._agent_runner = Runner(
+                agent=get_agent("studysync_orchestrator"),
+                app_name="studysync",
+                session_service=self.session_service
+            )
+        return self._agent_runner
 
     async def create_learning_path(
         self,
@@ -77,34 +179,64 @@ class LearningPathRunner:
             - status: "active"
             - progress: dict with completion tracking
         """
-        print(f"[LearningPathRunner] Creating learning path for: {topic}")
+        # Progress is delivered by a background task so a slow callback (e.g. an
+        # SSE write to a slow client) never holds up generation
+        relay = _ProgressRelay(progress_callback) if progress_callback else None
+        try:
+            return await self._build_learning_path(
+                topic,
+                assessment_responses=assessment_responses,
+                calendar_credentials=calendar_credentials,
+                start_date=start_date,
+                end_date=end_date,
+                commitment_level=commitment_level,
+                proficiency_level=proficiency_level,
+                progress_callback=relay
+            )
+        finally:
+            if relay:
+                await relay.aclose()
+
+    async def _build_learning_path(
+        self,
+        topic: str,
+        assessment_responses: Optional[List[Dict]] = None,
+        calendar_credentials: Optional[Dict] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        commitment_level: Optional[str] = None,
+        proficiency_level: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict:
+        """Run the direct-mode pipeline (see create_learning_path)."""
+        logger.info("Creating learning path for: %s", topic)
 
         # Step 1: Profile user
         if progress_callback:
             await progress_callback("profiling", "Analyzing your proficiency level...")
 
         # Use provided levels or assess
-        if proficiency_level and proficiency_level in ["beginner", "intermediate", "advanced"]:
+        if proficiency_level in VALID_PROFICIENCY_LEVELS:
             assessed_level = proficiency_level
-            print(f"[LearningPathRunner] Using provided proficiency: {assessed_level}")
+            logger.info("Using provided proficiency: %s", assessed_level)
         else:
             profile_result = assess_proficiency(topic, assessment_responses)
             assessed_level = profile_result["proficiency_level"]
-            print(f"[LearningPathRunner] Assessed proficiency: {assessed_level}")
+            logger.info("Assessed proficiency: %s", assessed_level)
 
-        # Determine commitment
-        if commitment_level and commitment_level in ["light", "moderate", "intensive"]:
+        # Determine commitment; with no calendar data to go on this is always the
+        # default, so there is no need to go through determine_commitment_level
+        if commitment_level in VALID_COMMITMENT_LEVELS:
             final_commitment = commitment_level
         else:
-            commitment_result = determine_commitment_level(user_preference="moderate")
-            final_commitment = commitment_result["commitment_level"]
+            final_commitment = _DEFAULT_COMMITMENT
 
         user_profile = {
             "topic": topic,
             "proficiency_level": assessed_level,
             "commitment_level": final_commitment,
             "preferences": {
-                "session_duration": 30 if final_commitment == "light" else (45 if final_commitment == "moderate" else 60)
+                "session_duration": COMMITMENT_CONFIG[final_commitment]["session_duration_minutes"]
             }
         }
 
@@ -119,109 +251,91 @@ class LearningPathRunner:
             await progress_callback("curriculum", f"Generating curriculum for {topic}...")
 
         # Calculate duration if dates provided
-        duration_weeks = None
-        if start_date and end_date:
-            try:
-                from datetime import datetime
-                start = datetime.fromisoformat(start_date)
-                end = datetime.fromisoformat(end_date)
-                days = (end - start).days
-                if days > 0:
-                    duration_weeks = max(1, round(days / 7, 1))
-            except Exception:
-                pass
-
-        curriculum = generate_curriculum(
+        span_days = _span_days(start_date, end_date)
+        duration_weeks = max(1, round(span_days / 7, 1)) if span_days else None
+
+        # The LLM call is blocking, so run it off the event loop
+        curriculum = await asyncio.to_thread(
+            generate_curriculum,
             topic=topic,
             proficiency_level=assessed_level,
             commitment_level=final_commitment,
             duration_weeks=duration_weeks
         )
 
-        num_modules = len(curriculum.get("modules", []))
-        print(f"[LearningPathRunner] Generated {num_modules} modules")
+        modules = curriculum.get("modules") or []
+        num_modules = len(modules)
+        logger.info("Generated %s modules", num_modules)
 
         if progress_callback:
-            module_titles = [m.get("title", "") for m in curriculum.get("modules", [])[:3]]
+            module_titles = [m.get("title", "") for m in modules[:3]]
             preview = ", ".join(module_titles)
             if num_modules > 3:
                 preview += f"... ({num_modules} total)"
             await progress_callback("curriculum", f"Curriculum ready: {preview}")
 
-        # Step 3: Create schedule
+        # Session topics are fixed by the curriculum, so resource lookups start
+        # now and overlap with scheduling and quiz generation
+        session_topics = _session_topics(modules)
         if progress_callback:
-            await progress_callback("scheduling", "Creating your study schedule...")
+            await progress_callback("resources", f"Finding resources for {len(session_topics)} sessions...")
 
-        schedule_result = create_study_schedule(
-            curriculum=curriculum,
-            commitment_level=final_commitment,
-            start_date=start_date,
-            end_date=end_date
+        resources_task = asyncio.create_task(
+            self._find_session_resources(
+                topic, session_topics, progress_callback, search_order=_interleaved_topics(modules)
+            )
         )
-        schedule = schedule_result.get("sessions", [])
-
-        print(f"[LearningPathRunner] Created {len(schedule)} sessions")
 
+        # Step 4: Quizzes depend only on the curriculum, so they also start now
         if progress_callback:
-            await progress_callback("scheduling", f"Schedule created with {len(schedule)} sessions")
+            await progress_callback("assessments", f"Generating quizzes for {num_modules} modules...")
+
+        assessments_task = asyncio.create_task(
+            self._generate_assessments(modules, assessed_level, progress_callback)
+        )
 
-        # Step 4: Generate assessments (parallel with resources in real implementation)
+        # Step 3: Create schedule
         if progress_callback:
-            await progress_callback("assessments", f"Generating quizzes for {num_modules} modules...")
+            await progress_callback("scheduling", "Creating your study schedule...")
 
-        assessments = []
-        for i, module in enumerate(curriculum.get("modules", [])):
-            # Extract subtopic names
-            subtopics = module.get("subtopics", [])
-            subtopic_names = []
-            for s in subtopics:
-                if isinstance(s, dict):
-                    subtopic_names.append(s.get("title", ""))
-                else:
-                    subtopic_names.append(str(s))
-
-            quiz = generate_module_quiz(
-                module_id=module.get("module_id", f"m{i+1}"),
-                module_title=module.get("title", ""),
-                subtopics=subtopic_names,
-                proficiency_level=assessed_level
+        try:
+            schedule_result = await asyncio.to_thread(
+                create_study_schedule,
+                curriculum=curriculum,
+                commitment_level=final_commitment,
+                start_date=start_date,
+                end_date=end_date,
+                calendar_credentials=calendar_credentials
             )
-            assessments.append(quiz)
+        except BaseException:
+            resources_task.cancel()
+            assessments_task.cancel()
+            raise
 
-            if progress_callback:
-                await progress_callback(
-                    "assessments",
-                    f"Quiz ready for {module.get('title', '')} ({i+1}/{num_modules})",
-                    {"current": i + 1, "total": num_modules}
-                )
+        schedule = schedule_result.get("sessions", [])
+        num_sessions = len(schedule)
 
-        print(f"[LearningPathRunner] Generated {len(assessments)} quizzes")
+        logger.info("Created %s sessions", num_sessions)
 
-        # Step 5: Find resources for each session
         if progress_callback:
-            await progress_callback("resources", f"Finding resources for {len(schedule)} sessions...")
+            await progress_callback("scheduling", f"Schedule created with {num_sessions} sessions")
 
-        total_resources = 0
-        for i, session in enumerate(schedule):
-            session_topic = session.get("session_topic", session.get("module_title", ""))
+        # Steps 4 & 5: Both have been running alongside scheduling
+        try:
+            assessments, session_resources = await asyncio.gather(assessments_task, resources_task)
+        except BaseException:
+            resources_task.cancel()
+            assessments_task.cancel()
+            raise
 
-            if progress_callback:
-                await progress_callback(
-                    "resources",
-                    f"Finding resources for {session_topic}...",
-                    {"current": i + 1, "total": len(schedule)}
-                )
-
-            resources = find_session_resources(
-                main_topic=topic,
-                session_topic=session_topic
-            )
-
-            # Combine videos and articles into session resources
-            session["resources"] = resources.get("videos", []) + resources.get("articles", [])
-            total_resources += len(session["resources"])
+        # Sessions are created in the same order as session_topics
+        total_resources = 0
+        for session, resources in zip(schedule, session_resources):
+            session["resources"] = resources
+            total_resources += len(resources)
 
-        print(f"[LearningPathRunner] Found {total_resources} total resources")
+        logger.info("Generated %s quizzes", len(assessments))
+        logger.info("Found %s total resources", total_resources)
 
         if progress_callback:
             await progress_callback("resources", f"Found {total_resources} resources for all sessions")
@@ -241,13 +355,151 @@ class LearningPathRunner:
                 "modules_completed": 0,
                 "sessions_completed": 0,
                 "total_modules": num_modules,
-                "total_sessions": len(schedule)
+                "total_sessions": num_sessions
             }
         }
 
-        print(f"[LearningPathRunner] Learning path complete!")
+        logger.info("Learning path complete!")
         return learning_path
 
+    async def _generate_assessments(
+        self,
+        modules: List[Dict],
+        proficiency_level: str,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> List[Dict]:
+        """Generate quizzes for all modules.
+
+        All quizzes are first requested from the LLM in a single batched call.
+        If that response cannot be used, each quiz becomes an independent,
+        blocking LLM call run in worker threads (bounded by QUIZ_CONCURRENCY),
+        with progress reported as each one finishes; a module whose quiz
+        fails gets an empty quiz. The returned list preserves the module order.
+        """
+        num_modules = len(modules)
+        if not num_modules:
+            return []
+
+        try:
+            assessments = await asyncio.to_thread(_batched_module_quizzes, modules)
+        except Exception as e:
+            logger.warning("Batched quiz generation failed: %s", e)
+            assessments = None
+
+        if assessments is not None:
+            if progress_callback:
+                await progress_callback(
+                    "assessments",
+                    f"Quizzes ready for all {num_modules} modules",
+                    {"current": num_modules, "total": num_modules}
+                )
+
+            return assessments
+
+        logger.warning("Falling back to per-module quiz generation")
+        semaphore = asyncio.Semaphore(QUIZ_CONCURRENCY)
+
+        async def generate(i: int, module: Dict):
+            module_id = module.get("module_id", f"m{i+1}")
+            module_title = module.get("title", "")
+            try:
+                async with semaphore:
+                    quiz = await asyncio.to_thread(
+                        generate_module_quiz,
+                        module_id=module_id,
+                        module_title=module_title,
+                        subtopics=module.get("subtopics", []),
+                        proficiency_level=proficiency_level
+                    )
+            except Exception as e:
+                # One failed module shouldn't sink the other quizzes or the path
+                logger.warning("Quiz generation failed for %s: %s", module_title, e)
+                quiz = {
+                    "module_id": module_id,
+                    "module_title": module_title,
+                    "assessment_type": "module_quiz",
+                    "questions": [],
+                    "total_questions": 0
+                }
+            return i, quiz
+
+        assessments: List[Optional[Dict]] = [None] * num_modules
+        tasks = [generate(i, module) for i, module in enumerate(modules)]
+
+        for completed, next_quiz in enumerate(asyncio.as_completed(tasks), start=1):
+            i, quiz = await next_quiz
+            assessments[i] = quiz
+
+            if progress_callback:
+                await progress_callback(
+                    "assessments",
+                    f"Quiz ready for {modules[i].get('title', '')} ({completed}/{num_modules})",
+                    {"current": completed, "total": num_modules}
+                )
+
+        return assessments
+
+    async def _find_session_resources(
+        self,
+        topic: str,
+        session_topics: List[str],
+        progress_callback: Optional[ProgressCallback] = None,
+        search_order: Optional[List[str]] = None
+    ) -> List[List[Dict]]:
+        """Find videos and articles for each session topic.
+
+        Repeated topics are searched only once. Unique topics are searched
+        concurrently in worker threads (bounded by RESOURCE_CONCURRENCY) and
+        progress is reported as they finish, at most once every
+        PROGRESS_MIN_INTERVAL seconds. A topic whose search fails gets no
+        resources. search_order, if given, is the order in which topics are
+        dispatched; results are always returned in session_topics order.
+
+        Returns:
+            One list of resources (videos then articles) per topic, in order.
+        """
+        unique_topics = list(dict.fromkeys(search_order or session_topics))
+        num_topics = len(unique_topics)
+        semaphore = asyncio.Semaphore(RESOURCE_CONCURRENCY)
+
+        async def search(session_topic: str):
+            # Searches are blocking network calls - keep them off the event loop
+            try:
+                async with semaphore:
+                    resources = await asyncio.to_thread(
+                        find_session_resources,
+                        main_topic=topic,
+                        session_topic=session_topic
+                    )
+            except Exception as e:
+                # A failed lookup leaves that session without resources instead of failing the path
+                logger.warning("Resource search failed for %s: %s", session_topic, e)
+                resources = {}
+            return session_topic, resources
+
+        topic_resources: Dict[str, List[Dict]] = {}
+        last_progress = 0.0
+        tasks = [search(session_topic) for session_topic in unique_topics]
+
+        for completed, next_topic in enumerate(asyncio.as_completed(tasks), start=1):
+            session_topic, resources = await next_topic
+
+            # Combine videos and articles into session resources
+            topic_resources[session_topic] = resources.get("videos", []) + resources.get("articles", [])
+
+            # Throttled so large schedules don't flood the progress stream
+            now = time.monotonic()
+            if progress_callback and (completed == num_topics or now - last_progress >= PROGRESS_MIN_INTERVAL):
+                last_progress = now
+                await progress_callback(
+                    "resources",
+                    f"Found resources for {session_topic} ({completed}/{num_topics})",
+                    {"current": completed, "total": num_topics}
+                )
+
+        # Each session gets its own list, even when it shares a topic with another
+        return [list(topic_resources[session_topic]) for session_topic in session_topics]
+
     async def create_learning_path_with_agents(
         self,
         topic: str,
@@ -277,7 +529,7 @@ class LearningPathRunner:
         Returns:
             Complete learning path dictionary (structure may vary based on agent output)
         """
-        print(f"[LearningPathRunner] Creating learning path with agents for: {topic}")
+        logger.info("Creating learning path with agents for: %s", topic)
 
         # Build initial state
         initial_state = {
@@ -290,63 +542,57 @@ class LearningPathRunner:
             "proficiency_level": proficiency_level,
         }
 
-        # Create session
+        # Create session (unique user id so concurrent runs never share a session slot)
+        user_id = f"user-{uuid.uuid4().hex}"
         session = await self.session_service.create_session(
             app_name="studysync",
-            user_id="user",
+            user_id=user_id,
             state=initial_state
         )
 
-        # Create runner
-        runner = Runner(
-            agent=studysync_orchestrator,
-            app_name="studysync",
-            session_service=self.session_service
-        )
-
         # Create message
         message = types.Content(
             role="user",
             parts=[types.Part(text=f"Create a complete learning path for: {topic}")]
         )
 
-        # Run the orchestrator
-        final_response = None
-        async for event in runner.run_async(
-            user_id="user",
-            session_id=session.id,
-            new_message=message
-        ):
-            # Log progress
-            if event.content:
-                try:
-                    text_parts = [p.text for p in event.content.parts if hasattr(p, 'text') and p.text]
-                    if text_parts and progress_callback:
-                        phase = "progress"
-                        if hasattr(event, 'author'):
-                            author = event.author.lower()
-                            if "profiler" in author:
-                                phase = "profiling"
-                            elif "curriculum" in author:
-                                phase = "curriculum"
-                            elif "scheduler" in author:
-                                phase = "scheduling"
-                            elif "resource" in author:
-                                phase = "resources"
-                            elif "assessment" in author:
-                                phase = "assessments"
-                        await progress_callback(phase, text_parts[0])
-                except Exception as e:
-                    print(f"[LearningPathRunner] Event processing error: {e}")
-
-            if hasattr(event, 'is_final_response') and event.is_final_response():
-                final_response = event
+        # Progress is relayed in the background so slow callbacks don't hold up event processing
+        relay = _ProgressRelay(progress_callback) if progress_callback else None
+
+        # Run the orchestrator; the result is read from session state afterwards,
+        # so events only matter for progress
+        try:
+            async for event in self.agent_runner.run_async(
+                user_id=user_id,
+                session_id=session.id,
+                new_message=message
+            ):
+                # Log progress
+                if relay and event.content:
+                    try:
+                        text = next((p.text for p in event.content.parts if getattr(p, 'text', None)), None)
+                        if text:
+                            phase = AUTHOR_TO_PHASE.get(getattr(event, 'author', ''), "progress")
+                            await relay(phase, text)
+                    except Exception as e:
+                        logger.warning("Event processing error: %s", e)
+        finally:
+            if relay:
+                await relay.aclose()
+
+        # Re-read the session: the object returned by create_session is a snapshot
+        # and does not reflect state written while the agents ran
+        session = await self.session_service.get_session(
+            app_name="studysync",
+            user_id=user_id,
+            session_id=session.id
+        )
 
         # Extract learning path from session state
-        learning_path = session.state.get("learning_path", {})
+        learning_path = session.state.get("learning_path", {}) if session else {}
 
         if not learning_path:
-            print("[LearningPathRunner] WARNING: No learning path in session state, returning empty")
+            logger.warning("No learning path in session state, returning empty")
             learning_path = {
                 "topic": topic,
                 "user_profile": {},
@@ -368,8 +614,7 @@ class LearningPathRunner:
         Returns:
             List of assessment question dicts
         """
-        from backend.agents.tools import generate_proficiency_assessment
-        result = generate_proficiency_assessment(topic)
+        result = await asyncio.to_thread(generate_proficiency_assessment, topic)
         return result.get("questions", [])
 
     async def evaluate_quiz(self, quiz: Dict, user_responses: Dict[str, str]) -> Dict:
@@ -382,5 +627,4 @@ class LearningPathRunner:
         Returns:
             Evaluation results with score, feedback, and knowledge gaps
         """
-        from backend.agents.tools import evaluate_quiz_responses
         return evaluate_quiz_responses(quiz, user_responses)
@@ -5,7 +5,19 @@ Tools can access session state via ToolContext parameter.
 """
 
 from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from html.parser import HTMLParser
+from bisect import bisect_right
+from itertools import chain, count, islice
+import logging
+import re
+import threading
+
+from backend.config import get_settings
+from backend.services.response_cache import TTLCache, make_cache_key
+
+logger = logging.getLogger(__name__)
 
 # Note: ToolContext is optional - tools work without ADK context for direct calls
 try:
@@ -17,9 +29,9 @@ except ImportError:
 # ============= Service Imports =============
 
 def _get_llm_service():
-    """Lazy load LLM service."""
-    from backend.services.llm_service import LLMService
-    return LLMService()
+    """Lazy load the shared LLM service."""
+    from backend.services.llm_service import get_llm_service
+    return get_llm_service()
 
 
 def _get_resource_service():
@@ -28,14 +40,23 @@ def _get_resource_service():
     return get_resource_discovery_service()
 
 
-def _get_calendar_service():
-    """Lazy load calendar service."""
+def _get_calendar_service(calendar_credentials: Dict):
+    """Lazy load calendar service for a user's OAuth credentials."""
     from backend.services.calendar_service import CalendarService
-    return CalendarService()
+    return CalendarService(calendar_credentials)
 
 
 # ============= User Profiler Tools =============
 
+# Calendar availability per user, reused for 15 minutes so profiling several
+# topics in a row makes one Google Calendar round-trip
+_availability_cache = TTLCache(maxsize=256, ttl=900)
+
+# Self-reported familiarity in assessment answers (advanced is checked first)
+_ADVANCED_ANSWER_RE = re.compile(r"advanced|expert", re.IGNORECASE)
+_INTERMEDIATE_ANSWER_RE = re.compile(r"intermediate|some experience", re.IGNORECASE)
+
+
 def assess_proficiency(
     topic: str,
     assessment_responses: List[Dict] = None,
@@ -72,10 +93,10 @@ def assess_proficiency(
         if response.get("is_correct"):
             score += 1
         # Check for self-reported familiarity
-        answer = str(response.get("user_answer", "")).lower()
-        if "advanced" in answer or "expert" in answer:
+        answer = str(response.get("user_answer", ""))
+        if _ADVANCED_ANSWER_RE.search(answer):
             score += 2
-        elif "intermediate" in answer or "some experience" in answer:
+        elif _INTERMEDIATE_ANSWER_RE.search(answer):
             score += 1
 
     # Calculate average and map to level
@@ -128,9 +149,20 @@ def analyze_calendar_availability(
             "calendar_analyzed": False
         }
 
+    # Keyed by a hash of the credentials; a refreshed token gets a fresh lookup
+    cache_key = make_cache_key(
+        "availability",
+        calendar_credentials.get("client_id"),
+        calendar_credentials.get("token"),
+    )
+
     try:
-        calendar_service = _get_calendar_service()
-        availability = calendar_service.get_availability(calendar_credentials)
+        availability = _availability_cache.get(cache_key)
+        if availability is None:
+            availability = _get_calendar_service(calendar_credentials).get_availability()
+            # Don't cache failures (e.g. an expired token) so the next call retries
+            if "error" not in availability:
+                _availability_cache.set(cache_key, availability)
 
         return {
             "weekly_free_hours": availability.get("weekly_free_hours", 10),
@@ -140,7 +172,7 @@ def analyze_calendar_availability(
             "calendar_analyzed": True
         }
     except Exception as e:
-        print(f"[assess_calendar] Calendar analysis failed: {e}")
+        logger.warning("Calendar analysis failed: %s", e)
         return {
             "weekly_free_hours": 10,
             "available_slots": [],
@@ -151,6 +183,40 @@ def analyze_calendar_availability(
         }
 
 
+# Weekly free hours at which each commitment level starts (light below 8h, intensive from 15h)
+_COMMITMENT_HOUR_THRESHOLDS = (8, 15)
+_COMMITMENT_LEVELS = ("light", "moderate", "intensive")
+
+# Session plan for each commitment level
+COMMITMENT_CONFIG = {
+    "light": {
+        "sessions_per_week": 2,
+        "session_duration_minutes": 30,
+        "weekly_study_hours": 2
+    },
+    "moderate": {
+        "sessions_per_week": 3,
+        "session_duration_minutes": 45,
+        "weekly_study_hours": 5
+    },
+    "intensive": {
+        "sessions_per_week": 5,
+        "session_duration_minutes": 60,
+        "weekly_study_hours": 10
+    }
+}
+
+# determine_commitment_level results, built once; callers get a copy
+_COMMITMENT_RESULTS = {
+    level: {"commitment_level": level, **config}
+    for level, config in COMMITMENT_CONFIG.items()
+}
+
+# Accepted values for explicit level overrides
+VALID_COMMITMENT_LEVELS = frozenset(_COMMITMENT_LEVELS)
+VALID_PROFICIENCY_LEVELS = frozenset(("beginner", "intermediate", "advanced"))
+
+
 def determine_commitment_level(
     weekly_hours: float = None,
     user_preference: str = None,
@@ -174,41 +240,14 @@ def determine_commitment_level(
         - 'weekly_study_hours': float expected study time per week
     """
     # User preference takes precedence
-    if user_preference and user_preference in ["light", "moderate", "intensive"]:
+    if user_preference in VALID_COMMITMENT_LEVELS:
         level = user_preference
     elif weekly_hours is not None:
-        if weekly_hours >= 15:
-            level = "intensive"
-        elif weekly_hours >= 8:
-            level = "moderate"
-        else:
-            level = "light"
+        level = _COMMITMENT_LEVELS[bisect_right(_COMMITMENT_HOUR_THRESHOLDS, weekly_hours)]
     else:
         level = "moderate"  # Default
 
-    # Map level to specifics
-    config = {
-        "light": {
-            "sessions_per_week": 2,
-            "session_duration_minutes": 30,
-            "weekly_study_hours": 2
-        },
-        "moderate": {
-            "sessions_per_week": 3,
-            "session_duration_minutes": 45,
-            "weekly_study_hours": 5
-        },
-        "intensive": {
-            "sessions_per_week": 5,
-            "session_duration_minutes": 60,
-            "weekly_study_hours": 10
-        }
-    }
-
-    return {
-        "commitment_level": level,
-        **config[level]
-    }
+    return dict(_COMMITMENT_RESULTS[level])
 
 
 # ============= Curriculum Tools =============
@@ -353,7 +392,7 @@ def estimate_curriculum_duration(
     # Estimate weeks
     estimated_weeks = total_sessions / sessions_per_week if sessions_per_week > 0 else total_sessions / 3
 
-    print(f"[estimate_curriculum_duration] {total_sessions} sessions, {estimated_weeks:.1f} weeks at {commitment_level}")
+    logger.info("Estimated %s sessions, %.1f weeks at %s", total_sessions, estimated_weeks, commitment_level)
 
     return {
         "total_hours": total_hours,
@@ -403,7 +442,7 @@ def generate_curriculum(
         duration_weeks=duration_weeks
     )
 
-    print(f"[generate_curriculum] Generated curriculum with {len(curriculum.get('modules', []))} modules")
+    logger.info("Generated curriculum with %s modules", len(curriculum.get('modules', [])))
     return curriculum
 
 
@@ -457,6 +496,27 @@ def generate_study_guide(
 
 # ============= Scheduler Tools =============
 
+# Session start hour for each preferred time of day
+_PREFERRED_HOURS = {"morning": 9, "afternoon": 14, "evening": 18}
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+def _now(tool_context: "ToolContext" = None) -> datetime:
+    """Current time, fixed for the whole agent invocation when there is a tool context.
+
+    Kept in temp: state (dropped when the invocation ends) so that every tool
+    defaulting to "tomorrow" during one run agrees on the date.
+    """
+    if tool_context is None:
+        return datetime.now()
+
+    now = tool_context.state.get("temp:request_now")
+    if now is None:
+        now = datetime.now().isoformat()
+        tool_context.state["temp:request_now"] = now
+    return datetime.fromisoformat(now)
+
+
 def generate_time_slots(
     num_slots: int,
     duration_minutes: int = 45,
@@ -502,60 +562,51 @@ def generate_time_slots(
             "span_weeks": 3.3
         }
     """
-    slots = []
-
     # Parse start date
     if start_date:
         try:
             current_date = datetime.fromisoformat(start_date)
         except ValueError:
-            current_date = datetime.now() + timedelta(days=1)
+            current_date = _now(tool_context) + timedelta(days=1)
     else:
-        current_date = datetime.now() + timedelta(days=1)
+        current_date = _now(tool_context) + timedelta(days=1)
 
     # Set preferred hour
-    hour_map = {"morning": 9, "afternoon": 14, "evening": 18}
-    default_hour = hour_map.get(preferred_time, 18)
-
-    sessions_this_week = 0
-    day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-
-    while len(slots) < num_slots:
-        # Skip weekends if requested
-        if skip_weekends and current_date.weekday() >= 5:
-            current_date += timedelta(days=1)
-            continue
-
-        # Check weekly limit
-        if sessions_this_week >= sessions_per_week:
-            days_to_monday = 7 - current_date.weekday()
-            current_date += timedelta(days=days_to_monday)
-            sessions_this_week = 0
-            continue
-
-        slot_start = current_date.replace(hour=default_hour, minute=0, second=0, microsecond=0)
-        slot_end = slot_start + timedelta(minutes=duration_minutes)
-
-        slots.append({
-            "slot_id": f"slot_{len(slots) + 1}",
+    default_hour = _PREFERRED_HOURS.get(preferred_time, 18)
+
+    days_per_week = 5 if skip_weekends else 7
+    sessions_per_week = max(1, sessions_per_week)
+    duration = timedelta(minutes=duration_minutes)
+
+    # Slots fill consecutive usable days from the start date until the week is
+    # full, then the first sessions_per_week usable days of each following week.
+    # Offsets are in days from the Monday of the starting week.
+    first_day = current_date.replace(hour=default_hour, minute=0, second=0, microsecond=0)
+    start_weekday = first_day.weekday()
+    week_start = first_day - timedelta(days=start_weekday)
+    first_week = range(start_weekday, min(days_per_week, start_weekday + sessions_per_week))
+    week_pattern = range(min(days_per_week, sessions_per_week))
+    day_offsets = list(islice(
+        chain(first_week, (week * 7 + day for week in count(1) for day in week_pattern)),
+        max(0, num_slots)
+    ))
+
+    slot_starts = [week_start + timedelta(days=offset) for offset in day_offsets]
+    slots = [
+        {
+            "slot_id": f"slot_{number}",
             "start": slot_start.isoformat(),
-            "end": slot_end.isoformat(),
+            "end": (slot_start + duration).isoformat(),
             "duration_minutes": duration_minutes,
-            "day_of_week": day_names[current_date.weekday()]
-        })
-
-        sessions_this_week += 1
-        current_date += timedelta(days=1)
+            "day_of_week": _DAY_NAMES[offset % 7]
+        }
+        for number, (offset, slot_start) in enumerate(zip(day_offsets, slot_starts), start=1)
+    ]
 
-    # Calculate span
-    if slots:
-        first_slot = datetime.fromisoformat(slots[0]["start"])
-        last_slot = datetime.fromisoformat(slots[-1]["start"])
-        span_weeks = (last_slot - first_slot).days / 7
-    else:
-        span_weeks = 0
+    # Slots share a time of day, so the span follows directly from the offsets
+    span_weeks = (day_offsets[-1] - day_offsets[0]) / 7 if day_offsets else 0
 
-    print(f"[generate_time_slots] Generated {len(slots)} slots over {span_weeks:.1f} weeks")
+    logger.info("Generated %s slots over %.1f weeks", len(slots), span_weeks)
 
     return {
         "slots": slots,
@@ -574,6 +625,7 @@ def schedule_session(
     total_sessions: int,
     learning_objectives: List[str] = None,
     main_topic: str = "",
+    duration_minutes: int = None,
     tool_context: "ToolContext" = None
 ) -> Dict:
     """Schedule a single study session into a time slot.
@@ -591,6 +643,7 @@ def schedule_session(
         total_sessions: Total number of sessions in the curriculum
         learning_objectives: List of objectives for this session
         main_topic: Main topic of the curriculum
+        duration_minutes: Session length overriding the slot's duration (optional)
         tool_context: ADK tool context for state access (optional)
 
     Returns:
@@ -627,13 +680,13 @@ def schedule_session(
         "learning_objectives": learning_objectives or [],
         "main_topic": main_topic,
         "scheduled_time": time_slot.get("start"),
-        "duration_minutes": time_slot.get("duration_minutes", 45),
+        "duration_minutes": duration_minutes if duration_minutes is not None else time_slot.get("duration_minutes", 45),
         "session_number": session_number,
         "total_sessions": total_sessions,
         "resources": []
     }
 
-    print(f"[schedule_session] Scheduled session {session_number}: {session_topic}")
+    logger.debug("Scheduled session %s: %s", session_number, session_topic)
     return session
 
 
@@ -663,7 +716,7 @@ def reschedule_session(
     updated_session["scheduled_time"] = new_time_slot.get("start")
     updated_session["duration_minutes"] = new_time_slot.get("duration_minutes", session.get("duration_minutes", 45))
 
-    print(f"[reschedule_session] Rescheduled session {session.get('session_number')} to {new_time_slot.get('start')}")
+    logger.info("Rescheduled session %s to %s", session.get('session_number'), new_time_slot.get('start'))
     return updated_session
 
 
@@ -709,15 +762,27 @@ def validate_schedule(
     # Sort sessions by time
     sorted_sessions = sorted(sessions, key=lambda s: s.get("scheduled_time", ""))
 
+    # Parse each start time once; an unparseable one keeps its error for the warning
+    starts = []
+    for session in sorted_sessions:
+        try:
+            starts.append(datetime.fromisoformat(session.get("scheduled_time", "")))
+        except (ValueError, TypeError) as e:
+            starts.append(e)
+
     # Check for overlaps
     for i in range(len(sorted_sessions) - 1):
         current = sorted_sessions[i]
         next_session = sorted_sessions[i + 1]
+        current_start = starts[i]
+        next_start = starts[i + 1]
 
         try:
-            current_start = datetime.fromisoformat(current.get("scheduled_time", ""))
+            if isinstance(current_start, Exception):
+                raise current_start
             current_end = current_start + timedelta(minutes=current.get("duration_minutes", 45))
-            next_start = datetime.fromisoformat(next_session.get("scheduled_time", ""))
+            if isinstance(next_start, Exception):
+                raise next_start
 
             # Check overlap
             if current_end > next_start:
@@ -737,13 +802,11 @@ def validate_schedule(
 
     # Calculate stats
     try:
-        first_time = datetime.fromisoformat(sorted_sessions[0].get("scheduled_time", ""))
-        last_time = datetime.fromisoformat(sorted_sessions[-1].get("scheduled_time", ""))
-        span_days = (last_time - first_time).days
-    except (ValueError, TypeError):
+        span_days = (starts[-1] - starts[0]).days
+    except TypeError:
         span_days = 0
 
-    print(f"[validate_schedule] Validated {len(sessions)} sessions: {len(conflicts)} conflicts, {len(warnings)} warnings")
+    logger.info("Validated %s sessions: %s conflicts, %s warnings", len(sessions), len(conflicts), len(warnings))
 
     return {
         "valid": len(conflicts) == 0,
@@ -756,12 +819,84 @@ def validate_schedule(
     }
 
 
+def _span_days(start_date: Optional[str], end_date: Optional[str]) -> Optional[int]:
+    """Days from start_date to end_date (ISO strings), or None if either is missing or invalid.
+
+    Shared by the runner (curriculum length) and create_study_schedule
+    (sessions per week) so both read the window the same way.
+    """
+    if not (start_date and end_date):
+        return None
+    try:
+        days = (datetime.fromisoformat(end_date) - datetime.fromisoformat(start_date)).days
+    except (TypeError, ValueError) as e:
+        logger.warning("Invalid date range %r - %r: %s", start_date, end_date, e)
+        return None
+    return days if days > 0 else None
+
+
+def _iter_session_specs(modules: List[Dict], default_minutes: int):
+    """Yield (module, topic_title, topic_description, minutes) for each session, in order.
+
+    Each subtopic (dict or plain string) becomes one session; a module
+    without subtopics gets a single introductory session named after it.
+    """
+    session_number = 0
+    for module in modules:
+        subtopics = module.get("subtopics", [])
+
+        if not subtopics:
+            session_number += 1
+            title = module.get("title", "")
+            yield module, title, f"Introduction to {title}", default_minutes
+            continue
+
+        for subtopic in subtopics:
+            session_number += 1
+            if isinstance(subtopic, dict):
+                title = subtopic.get("title", f"Topic {session_number}")
+                description = subtopic.get("description", f"Learn about {title}")
+                yield module, title, description, subtopic.get("estimated_minutes", default_minutes)
+            else:
+                title = str(subtopic)
+                yield module, title, f"Learn about {title}", default_minutes
+
+
+def _calendar_slots(
+    calendar_credentials: Dict,
+    num_slots: int,
+    duration_minutes: int,
+    sessions_per_week: int,
+    start_date: Optional[str],
+    tool_context: "ToolContext" = None
+) -> List[Dict]:
+    """Find free calendar slots for the sessions, or [] if the calendar can't be read.
+
+    Slots are paced like generate_time_slots' defaults: evenings, at most
+    sessions_per_week per week, weekends only when that pace needs them.
+    """
+    try:
+        start = datetime.fromisoformat(start_date) if start_date else _now(tool_context) + timedelta(days=1)
+        return _get_calendar_service(calendar_credentials).find_free_slots(
+            start,
+            num_slots,
+            duration_minutes,
+            sessions_per_week=sessions_per_week,
+            preferred_hour=_PREFERRED_HOURS["evening"],
+            skip_weekends=(sessions_per_week <= 5)
+        )
+    except Exception as e:
+        logger.warning("Calendar slot lookup failed, using default slots: %s", e)
+        return []
+
+
 def create_study_schedule(
     curriculum: Dict,
     commitment_level: str,
     start_date: str = None,
     end_date: str = None,
     calendar_credentials: Dict = None,
+    use_calendar_slots: bool = False,
     tool_context: "ToolContext" = None
 ) -> Dict:
     """Create a complete study schedule from a curriculum.
@@ -775,6 +910,8 @@ def create_study_schedule(
         start_date: Optional start date in ISO format (YYYY-MM-DD)
         end_date: Optional end date in ISO format (YYYY-MM-DD)
         calendar_credentials: Optional Google Calendar credentials for slot finding
+        use_calendar_slots: Look up free slots in the calendar (one Google API
+            call); off by default so scheduling stays local
         tool_context: ADK tool context for state access (optional)
 
     Returns:
@@ -786,108 +923,91 @@ def create_study_schedule(
     sessions_per_week = commitment_config["sessions_per_week"]
     session_duration = commitment_config["session_duration_minutes"]
 
-    modules = curriculum.get("modules", [])
+    modules = curriculum.get("modules") or []
     main_topic = curriculum.get("topic", "")
 
-    # Count total sessions needed (one per subtopic)
-    total_sessions = 0
-    for module in modules:
-        subtopics = module.get("subtopics", [])
-        if subtopics:
-            total_sessions += len(subtopics)
-        else:
-            total_sessions += 1
+    # One session per subtopic, resolved once and used for both the count and the sessions
+    session_specs = list(_iter_session_specs(modules, session_duration))
+    total_sessions = len(session_specs)
 
     # Adjust sessions per week if end_date is constrained
-    if start_date and end_date:
-        try:
-            start = datetime.fromisoformat(start_date)
-            end = datetime.fromisoformat(end_date)
-            weeks = (end - start).days / 7
-            if weeks > 0:
-                required_per_week = total_sessions / weeks
-                sessions_per_week = max(sessions_per_week, int(required_per_week) + 1)
-        except Exception as e:
-            print(f"[create_study_schedule] Date calculation error: {e}")
-
-    # Generate time slots using modular tool
-    slots_result = generate_time_slots(
-        num_slots=total_sessions,
-        duration_minutes=session_duration,
-        sessions_per_week=sessions_per_week,
-        start_date=start_date,
-        skip_weekends=(sessions_per_week <= 5)
-    )
-    slots = slots_result.get("slots", [])
+    span_days = _span_days(start_date, end_date)
+    if span_days:
+        required_per_week = total_sessions / (span_days / 7)
+        sessions_per_week = max(sessions_per_week, int(required_per_week) + 1)
+
+    # Prefer free slots from the user's calendar when it can cover every session
+    slots = []
+    if use_calendar_slots and calendar_credentials:
+        slots = _calendar_slots(
+            calendar_credentials, total_sessions, session_duration, sessions_per_week, start_date, tool_context
+        )
+
+    if len(slots) < total_sessions:
+        # Generate time slots using modular tool, with the pacing computed above
+        slots_result = generate_time_slots(
+            num_slots=total_sessions,
+            duration_minutes=session_duration,
+            sessions_per_week=sessions_per_week,
+            start_date=start_date,
+            skip_weekends=(sessions_per_week <= 5),
+            tool_context=tool_context
+        )
+        slots = slots_result.get("slots", [])
 
     # Create sessions using modular tool
     sessions = []
-    session_idx = 0
-    session_number = 1
-
-    for module in modules:
-        subtopics = module.get("subtopics", [])
-        module_objectives = module.get("learning_objectives", [])
-
-        if subtopics:
-            for subtopic in subtopics:
-                if session_idx >= len(slots):
-                    break
-
-                # Handle subtopic as dict or string
-                if isinstance(subtopic, dict):
-                    topic_title = subtopic.get("title", f"Topic {session_number}")
-                    topic_desc = subtopic.get("description", f"Learn about {topic_title}")
-                    topic_minutes = subtopic.get("estimated_minutes", session_duration)
-                else:
-                    topic_title = str(subtopic)
-                    topic_desc = f"Learn about {topic_title}"
-                    topic_minutes = session_duration
-
-                # Update slot duration if subtopic has specific duration
-                slot = slots[session_idx].copy()
-                slot["duration_minutes"] = topic_minutes
-
-                session = schedule_session(
-                    module_id=module.get("module_id", f"m{len(sessions) + 1}"),
-                    module_title=module.get("title", ""),
-                    session_topic=topic_title,
-                    session_description=topic_desc,
-                    time_slot=slot,
-                    session_number=session_number,
-                    total_sessions=total_sessions,
-                    learning_objectives=module_objectives,
-                    main_topic=main_topic
-                )
-                sessions.append(session)
-                session_idx += 1
-                session_number += 1
-        else:
-            # No subtopics - create single session for module
-            if session_idx >= len(slots):
-                break
-
-            session = schedule_session(
-                module_id=module.get("module_id", f"m{len(sessions) + 1}"),
-                module_title=module.get("title", ""),
-                session_topic=module.get("title", ""),
-                session_description=f"Introduction to {module.get('title', '')}",
-                time_slot=slots[session_idx],
-                session_number=session_number,
-                total_sessions=total_sessions,
-                learning_objectives=module_objectives,
-                main_topic=main_topic
-            )
-            sessions.append(session)
-            session_idx += 1
-            session_number += 1
-
-    print(f"[create_study_schedule] Created {len(sessions)} sessions")
+    current_module = None
+
+    # zip stops at whichever runs out first, sessions or slots
+    for session_number, ((module, topic_title, topic_desc, topic_minutes), time_slot) in enumerate(
+        zip(session_specs, slots), start=1
+    ):
+        # Module fields are the same for all of its sessions, so only look them up on a new module
+        if module is not current_module:
+            current_module = module
+            module_title = module.get("title", "")
+            learning_objectives = module.get("learning_objectives", [])
+
+        session = schedule_session(
+            module_id=module.get("module_id", f"m{len(sessions) + 1}"),
+            module_title=module_title,
+            session_topic=topic_title,
+            session_description=topic_desc,
+            time_slot=time_slot,
+            session_number=session_number,
+            total_sessions=total_sessions,
+            learning_objectives=learning_objectives,
+            main_topic=main_topic,
+            duration_minutes=topic_minutes
+        )
+        sessions.append(session)
+
+    logger.info("Created %s sessions", len(sessions))
     return {"sessions": sessions}
 
 
 # ============= Assessment Tools =============
 
+# Modules per batched quiz request; past a handful, one response gets slow
+# and a single malformed answer throws away more work
+QUIZ_BATCH_SIZE = 6
+
+# Runs the batches of a large curriculum concurrently
+_quiz_batch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="quiz-batch")
+
+
+def _quiz_result(module_id: str, module_title: str, questions: List[Dict]) -> Dict:
+    """Shape a module's questions as a generate_module_quiz result."""
+    return {
+        "module_id": module_id,
+        "module_title": module_title,
+        "assessment_type": "module_quiz",
+        "questions": questions,
+        "total_questions": len(questions)
+    }
+
+
 def generate_module_quiz(
     module_id: str,
     module_title: str,
@@ -928,17 +1048,93 @@ def generate_module_quiz(
         num_questions=num_questions
     )
 
-    print(f"[generate_module_quiz] Generated {len(questions)} questions for {module_title}")
+    logger.info("Generated %s questions for %s", len(questions), module_title)
+    return _quiz_result(module_id, module_title, questions)
+
+
+def generate_module_quizzes_batch(
+    modules: List[Dict],
+    proficiency_level: str = "beginner",
+    num_questions: int = 5,
+    tool_context: "ToolContext" = None
+) -> Dict:
+    """Generate quizzes for several curriculum modules in one LLM request.
+
+    Prefer this over calling generate_module_quiz once per module: all
+    modules share a single prompt and round-trip. If the batched response
+    can't be used, quizzes are generated one module at a time instead.
+
+    Args:
+        modules: List of curriculum module dicts with 'module_id', 'title' and 'subtopics'
+        proficiency_level: Target difficulty ("beginner", "intermediate", "advanced")
+        num_questions: Number of questions per quiz (default 5)
+        tool_context: ADK tool context for state access (optional)
+
+    Returns:
+        dict with:
+        - 'quizzes': list of quiz dicts in module order, each shaped like the
+          result of generate_module_quiz
+        - 'total_quizzes': int number of quizzes
+    """
+    quizzes = None
+    try:
+        quizzes = _batched_module_quizzes(modules, num_questions)
+    except Exception as e:
+        logger.warning("Batched generation failed: %s", e)
+
+    if quizzes is None:
+        logger.warning("Falling back to per-module generation")
+        quizzes = [
+            generate_module_quiz(
+                module_id=module.get("module_id", f"m{i+1}"),
+                module_title=module.get("title", ""),
+                subtopics=module.get("subtopics", []),
+                proficiency_level=proficiency_level,
+                num_questions=num_questions
+            )
+            for i, module in enumerate(modules)
+        ]
 
     return {
-        "module_id": module_id,
-        "module_title": module_title,
-        "assessment_type": "module_quiz",
-        "questions": questions,
-        "total_questions": len(questions)
+        "quizzes": quizzes,
+        "total_quizzes": len(quizzes)
     }
 
 
+def _batched_module_quizzes(modules: List[Dict], num_questions: int = 5) -> Optional[List[Dict]]:
+    """Build quiz dicts for all modules from batched LLM calls.
+
+    Modules are sent QUIZ_BATCH_SIZE at a time, with the batches running
+    concurrently. Returns None when any batched response can't be used, so
+    callers can fall back to per-module generation (quizzes from the batches
+    that did succeed are already cached by the LLM service).
+    """
+    if not modules:
+        return []
+
+    specs = [{"title": module.get("title", ""), "subtopics": module.get("subtopics", [])} for module in modules]
+    batches = [specs[i:i + QUIZ_BATCH_SIZE] for i in range(0, len(specs), QUIZ_BATCH_SIZE)]
+
+    llm_service = _get_llm_service()
+    if len(batches) == 1:
+        batch_results = [llm_service.generate_quizzes_batch(batches[0], num_questions=num_questions)]
+    else:
+        batch_results = list(_quiz_batch_executor.map(
+            lambda batch: llm_service.generate_quizzes_batch(batch, num_questions=num_questions),
+            batches
+        ))
+
+    if any(questions is None for questions in batch_results):
+        return None
+
+    logger.info("Generated quizzes for %s modules in %s batched requests", len(modules), len(batches))
+
+    return [
+        _quiz_result(module.get("module_id", f"m{i+1}"), module.get("title", ""), questions)
+        for i, (module, questions) in enumerate(zip(modules, chain.from_iterable(batch_results)))
+    ]
+
+
 def evaluate_quiz_responses(
     quiz: Dict,
     user_responses: Dict[str, str],
@@ -968,29 +1164,73 @@ def evaluate_quiz_responses(
             - 'explanation': str
         - 'knowledge_gaps': list of improvement suggestions
     """
-    correct_count = 0
-    questions = quiz.get("questions", [])
-    total_questions = len(questions)
-    results = []
-
-    for idx, question in enumerate(questions):
-        question_id = str(idx)
-        # Support both "0" and "q0" formats from frontend
-        user_answer = user_responses.get(question_id, "") or user_responses.get(f"q{idx}", "")
-        correct_answer = question.get("correct_answer", "")
+    return _grade_submission(_answer_key(quiz.get("questions", [])), user_responses)
 
-        is_correct = user_answer.upper() == correct_answer.upper()
-        if is_correct:
-            correct_count += 1
 
-        results.append({
-            "question_id": question_id,
-            "question": question.get("question", ""),
+def evaluate_quiz_batch(
+    quiz: Dict,
+    submissions: List[Dict[str, str]],
+    tool_context: "ToolContext" = None
+) -> List[Dict]:
+    """Evaluate many submissions of the same quiz.
+
+    The question fields and normalized answer key are read once and shared
+    across every submission, instead of once per call to evaluate_quiz_responses.
+
+    Args:
+        quiz: Quiz dict with 'questions' list
+        submissions: List of user_responses dicts (see evaluate_quiz_responses)
+        tool_context: ADK tool context for state access (optional)
+
+    Returns:
+        List of evaluation dicts in submission order, each shaped like the
+        return value of evaluate_quiz_responses
+    """
+    answer_key = _answer_key(quiz.get("questions", []))
+    return [_grade_submission(answer_key, responses) for responses in submissions]
+
+
+def _answer_key(questions: List[Dict]) -> List[tuple]:
+    """Read each question's grading fields once.
+
+    Returns (question_text, explanation, correct_answer, correct_answer.upper())
+    per question, so grading never touches the question dicts again.
+    """
+    answer_key = []
+    for question in questions:
+        correct_answer = question.get("correct_answer", "")
+        answer_key.append((
+            question.get("question", ""),
+            question.get("explanation", ""),
+            correct_answer,
+            correct_answer.upper(),
+        ))
+    return answer_key
+
+
+def _grade_submission(answer_key: List[tuple], user_responses: Dict[str, str]) -> Dict:
+    """Grade one set of responses against a prebuilt answer key."""
+    total_questions = len(answer_key)
+
+    # Support both "0" and "q0" formats from frontend
+    user_answers = [
+        user_responses.get(str(idx), "") or user_responses.get(f"q{idx}", "")
+        for idx in range(total_questions)
+    ]
+
+    results = [
+        {
+            "question_id": str(idx),
+            "question": question_text,
             "user_answer": user_answer,
             "correct_answer": correct_answer,
-            "is_correct": is_correct,
-            "explanation": question.get("explanation", "")
-        })
+            "is_correct": user_answer.upper() == correct_upper,
+            "explanation": explanation
+        }
+        for idx, (user_answer, (question_text, explanation, correct_answer, correct_upper))
+        in enumerate(zip(user_answers, answer_key))
+    ]
+    correct_count = sum(result["is_correct"] for result in results)
 
     score = correct_count / total_questions if total_questions > 0 else 0
 
@@ -1105,7 +1345,7 @@ def search_youtube(
     for video in videos:
         video["quality_score"] = service.score_video_quality(video)
 
-    print(f"[search_youtube] Found {len(videos)} videos for: {query}")
+    logger.debug("Found %s videos for: %s", len(videos), query)
 
     return {
         "query": query,
@@ -1169,7 +1409,7 @@ def search_web(
     for article in articles:
         article["quality_score"] = service.score_article_quality(article)
 
-    print(f"[search_web] Found {len(articles)} articles for: {query}")
+    logger.debug("Found %s articles for: %s", len(articles), query)
 
     return {
         "query": query,
@@ -1178,6 +1418,37 @@ def search_web(
     }
 
 
+# Tags whose text is never page content
+_NON_CONTENT_TAGS = frozenset(("script", "style", "noscript"))
+
+_browse_client = None
+_browse_client_lock = threading.Lock()
+
+
+def _get_browse_client():
+    """Get the shared keep-alive HTTP client used by browse_url."""
+    global _browse_client
+    with _browse_client_lock:
+        if _browse_client is None or _browse_client.is_closed:
+            import httpx
+            _browse_client = httpx.Client(
+                timeout=10.0,
+                follow_redirects=True,
+                headers={"User-Agent": "Mozilla/5.0 (compatible; StudySync/1.0; Educational Resource Checker)"},
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            )
+        return _browse_client
+
+
+def close_browse_client() -> None:
+    """Close the shared browse_url connection pool (call on application shutdown)."""
+    global _browse_client
+    with _browse_client_lock:
+        if _browse_client is not None:
+            _browse_client.close()
+            _browse_client = None
+
+
 def browse_url(
     url: str,
     tool_context: "ToolContext" = None
@@ -1215,9 +1486,6 @@ def browse_url(
             "word_count": 2500
         }
     """
-    import httpx
-    from html.parser import HTMLParser
-
     class SimpleHTMLParser(HTMLParser):
         def __init__(self):
             super().__init__()
@@ -1249,17 +1517,14 @@ def browse_url(
         def handle_data(self, data):
             if self.in_title:
                 self.title += data.strip()
-            elif self.in_body and self.current_tag not in ["script", "style", "noscript"]:
+            elif self.in_body and self.current_tag not in _NON_CONTENT_TAGS:
                 text = data.strip()
                 if text:
                     self.body_text.append(text)
 
     try:
-        with httpx.Client(timeout=10.0, follow_redirects=True) as client:
-            response = client.get(url, headers={
-                "User-Agent": "Mozilla/5.0 (compatible; StudySync/1.0; Educational Resource Checker)"
-            })
-            response.raise_for_status()
+        response = _get_browse_client().get(url)
+        response.raise_for_status()
 
         content = response.text
         parser = SimpleHTMLParser()
@@ -1281,7 +1546,7 @@ def browse_url(
 
         description = parser.description or (body_content[:200] + "..." if len(body_content) > 200 else body_content)
 
-        print(f"[browse_url] Successfully fetched: {url[:50]}...")
+        logger.debug("Successfully fetched: %s...", url[:50])
 
         return {
             "url": url,
@@ -1294,7 +1559,7 @@ def browse_url(
         }
 
     except Exception as e:
-        print(f"[browse_url] Failed to fetch {url}: {e}")
+        logger.warning("Failed to fetch %s: %s", url, e)
         return {
             "url": url,
             "success": False,
@@ -1357,7 +1622,7 @@ def filter_resources_by_quality(
     removed_count = len(resources) - len(filtered)
     avg_quality = sum(r.get("quality_score", 0.5) for r in filtered) / len(filtered) if filtered else 0
 
-    print(f"[filter_resources_by_quality] Kept {len(filtered)}/{len(resources)} resources (min_score={min_quality_score})")
+    logger.info("Kept %s/%s resources (min_score=%s)", len(filtered), len(resources), min_quality_score)
 
     return {
         "filtered": filtered,
@@ -1366,6 +1631,32 @@ def filter_resources_by_quality(
     }
 
 
+# Runs the video half of find_session_resources so both searches overlap
+_search_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="resource-search")
+
+# Final picks per session topic; topics recur across sessions and users
+_session_resource_cache = TTLCache(maxsize=2048, ttl=get_settings().resource_cache_ttl)
+
+
+def clear_resource_cache() -> None:
+    """Drop cached session resources and the underlying search results."""
+    from backend.services.resource_discovery_service import clear_search_cache
+    _session_resource_cache.clear()
+    clear_search_cache()
+
+
+def _first_k_by_quality(resources: List[Dict], k: int, min_score: float) -> List[Dict]:
+    """Return the first k resources, in search order, with quality_score >= min_score.
+
+    Stops scanning once k are found. Falls back to the first k resources when
+    none meet the threshold.
+    """
+    quality = list(islice(
+        (resource for resource in resources if resource.get("quality_score", 0) >= min_score), k
+    ))
+    return quality if quality else resources[:k]
+
+
 # Legacy function for backward compatibility with runner.py
 def find_session_resources(
     main_topic: str,
@@ -1389,19 +1680,27 @@ def find_session_resources(
     Returns:
         dict with 'videos' and 'articles' lists
     """
-    # Search for videos
-    video_results = search_youtube(f"{session_topic} tutorial", max_results=num_videos + 2)
-    videos = video_results.get("results", [])
-    quality_videos = [v for v in videos if v.get("quality_score", 0) >= 0.4]
-    final_videos = quality_videos[:num_videos] if quality_videos else videos[:num_videos]
-
-    # Search for articles
+    cache_key = make_cache_key("session_resources", main_topic, session_topic, num_videos, num_articles)
+    cached = _session_resource_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("Using cached resources for: %s", session_topic)
+        return cached
+
+    # Search for videos in the background while searching for articles here
+    video_future = _search_executor.submit(search_youtube, f"{session_topic} tutorial", max_results=num_videos + 2)
     article_results = search_web(f"{session_topic} guide tutorial", max_results=num_articles + 2)
-    articles = article_results.get("results", [])
-    quality_articles = [a for a in articles if a.get("quality_score", 0) >= 0.3]
-    final_articles = quality_articles[:num_articles] if quality_articles else articles[:num_articles]
+    video_results = video_future.result()
 
-    return {
+    final_videos = _first_k_by_quality(video_results.get("results", []), num_videos, min_score=0.4)
+    final_articles = _first_k_by_quality(article_results.get("results", []), num_articles, min_score=0.3)
+
+    result = {
         "videos": final_videos,
         "articles": final_articles
     }
+    # Failed searches return fallback placeholders; leave those uncached so the next call retries
+    if (final_videos or final_articles) and not any(
+        resource.get("is_fallback") for resource in chain(final_videos, final_articles)
+    ):
+        _session_resource_cache.set(cache_key, result)
+    return result
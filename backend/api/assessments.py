@@ -1,9 +1,10 @@
 """Assessments API endpoints."""
 
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-from typing import Dict
+from typing import Dict, Optional
 from datetime import datetime
 import json
 
@@ -24,13 +25,25 @@ class SubmitQuizRequest(BaseModel):
     responses: Dict[str, str]  # Map of question_id to answer
 
 
+def _module_title(learning_path: Optional[LearningPath], module_id: str) -> str:
+    """Look up a module's title in a learning path's curriculum, defaulting to its id."""
+    if not learning_path or not learning_path.curriculum:
+        return module_id
+    modules = json.loads(learning_path.curriculum).get("modules") or []
+    for module in modules:
+        if module.get("module_id") == module_id:
+            return module.get("title", module_id)
+    return module_id
+
+
 @router.post("/proficiency")
 async def get_proficiency_assessment_endpoint(
     request: ProficiencyAssessmentRequest
 ):
     """Get proficiency assessment questions for a topic."""
     try:
-        result = generate_proficiency_assessment(request.topic)
+        # Blocking LLM call - run it off the event loop
+        result = await asyncio.to_thread(generate_proficiency_assessment, request.topic)
         return {
             "topic": request.topic,
             "questions": result.get("questions", [])
@@ -66,12 +79,7 @@ async def get_module_quiz(
     questions = json.loads(assessment.questions) if assessment.questions else []
 
     # Get module title from curriculum
-    module_title = module_id  # Default to module_id
-    curriculum = json.loads(learning_path.curriculum) if learning_path.curriculum else {}
-    for module in curriculum.get("modules", []):
-        if module.get("module_id") == module_id:
-            module_title = module.get("title", module_id)
-            break
+    module_title = _module_title(learning_path, module_id)
 
     return {
         "assessment_id": assessment.id,
@@ -110,13 +118,7 @@ async def get_quiz_results(
         LearningPath.id == learning_path_id
     ).first()
 
-    module_title = module_id
-    if learning_path:
-        curriculum = json.loads(learning_path.curriculum) if learning_path.curriculum else {}
-        for module in curriculum.get("modules", []):
-            if module.get("module_id") == module_id:
-                module_title = module.get("title", module_id)
-                break
+    module_title = _module_title(learning_path, module_id)
 
     # Rebuild results from stored data
     results = []
@@ -7,15 +7,18 @@ from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import Optional, List as ListType, Literal
 import json
+import logging
 
 from backend.database import get_db
 from backend.models import User, LearningPath, StudySession, Assessment
 from backend.services.progress_tracker import create_progress_tracker, ProgressEvent
 
+logger = logging.getLogger(__name__)
+
 # Import the refactored LearningPathRunner (ADK Agent Team pattern)
 from backend.agents.runner import LearningPathRunner
 orchestrator = LearningPathRunner()
-print("[API] Using ADK Agent Team orchestrator")
+logger.info("Using ADK Agent Team orchestrator")
 
 from datetime import datetime
 
@@ -48,6 +51,63 @@ class LearningPathResponse(BaseModel):
         from_attributes = True
 
 
+# Compact separators: stored columns and SSE payloads are only ever read back by machines
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _save_learning_path(db: Session, user_id: str, topic: str, learning_path_data: dict) -> LearningPath:
+    """Persist a generated learning path with its study sessions and assessments."""
+    learning_path = LearningPath(
+        user_id=user_id,
+        topic=topic,
+        proficiency_level=learning_path_data["user_profile"]["proficiency_level"],
+        commitment_level=learning_path_data["user_profile"]["commitment_level"],
+        curriculum=_dumps(learning_path_data["curriculum"]),
+        schedule=_dumps(learning_path_data["schedule"]),
+        status="active"
+    )
+
+    db.add(learning_path)
+    db.commit()
+    db.refresh(learning_path)
+
+    # Create study sessions
+    sessions = []
+    for session_data in learning_path_data["schedule"]:
+        # Parse scheduled_time string to datetime object
+        scheduled_time = datetime.fromisoformat(session_data["scheduled_time"])
+        sessions.append(StudySession(
+            learning_path_id=learning_path.id,
+            module_id=session_data["module_id"],
+            module_title=session_data["module_title"],
+            session_topic=session_data.get("session_topic"),
+            description=session_data.get("session_description") or session_data.get("description"),
+            learning_objectives=_dumps(session_data.get("learning_objectives", [])),
+            scheduled_time=scheduled_time,
+            duration_minutes=session_data["duration_minutes"],
+            resources=_dumps(session_data.get("resources", [])),
+            session_number=session_data.get("session_number")
+        ))
+    db.add_all(sessions)
+
+    # Create assessments (with error handling for malformed quizzes)
+    for assessment_data in learning_path_data["assessments"]:
+        try:
+            assessment = Assessment(
+                learning_path_id=learning_path.id,
+                module_id=assessment_data["module_id"],
+                assessment_type=assessment_data["assessment_type"],
+                questions=_dumps(assessment_data["questions"])
+            )
+            db.add(assessment)
+        except Exception as e:
+            logger.warning("Failed to create assessment for module %s: %s", assessment_data.get('module_id'), e)
+            # Continue with other assessments
+
+    db.commit()
+    return learning_path
+
+
 @router.post("", response_model=dict)
 async def create_learning_path(
     request: CreateLearningPathRequest,
@@ -78,55 +138,8 @@ async def create_learning_path(
         )
 
         # Save to database
-        learning_path = LearningPath(
-            user_id=demo_user.id,
-            topic=request.topic,
-            proficiency_level=learning_path_data["user_profile"]["proficiency_level"],
-            commitment_level=learning_path_data["user_profile"]["commitment_level"],
-            curriculum=json.dumps(learning_path_data["curriculum"]),
-            schedule=json.dumps(learning_path_data["schedule"]),
-            status="active"
-        )
-
-        db.add(learning_path)
-        db.commit()
-        db.refresh(learning_path)
-
-        # Create study sessions
-        for session_data in learning_path_data["schedule"]:
-            # Parse scheduled_time string to datetime object
-            scheduled_time = datetime.fromisoformat(session_data["scheduled_time"])
-            
-            session = StudySession(
-                learning_path_id=learning_path.id,
-                module_id=session_data["module_id"],
-                module_title=session_data["module_title"],
-                session_topic=session_data.get("session_topic"),
-                description=session_data.get("session_description") or session_data.get("description"),
-                learning_objectives=json.dumps(session_data.get("learning_objectives", [])),
-                scheduled_time=scheduled_time,
-                duration_minutes=session_data["duration_minutes"],
-                resources=json.dumps(session_data.get("resources", [])),
-                session_number=session_data.get("session_number")
-            )
-            db.add(session)
-
-        # Create assessments (with error handling for malformed quizzes)
-        for assessment_data in learning_path_data["assessments"]:
-            try:
-                assessment = Assessment(
-                    learning_path_id=learning_path.id,
-                    module_id=assessment_data["module_id"],
-                    assessment_type=assessment_data["assessment_type"],
-                    questions=json.dumps(assessment_data["questions"])
-                )
-                db.add(assessment)
-            except Exception as e:
-                print(f"Warning: Failed to create assessment for module {assessment_data.get('module_id')}: {e}")
-                # Continue with other assessments
-
-        db.commit()
-        print(f"[API] Successfully created learning path with {len(learning_path_data['schedule'])} sessions")
+        learning_path = _save_learning_path(db, demo_user.id, request.topic, learning_path_data)
+        logger.info("Successfully created learning path with %s sessions", len(learning_path_data['schedule']))
 
         # Build response carefully to avoid serialization issues
         response_data = {
@@ -139,13 +152,11 @@ async def create_learning_path(
             "progress": learning_path_data["progress"]
         }
 
-        print(f"[API] Returning response for learning path {learning_path.id}")
+        logger.info("Returning response for learning path %s", learning_path.id)
         return response_data
 
     except Exception as e:
-        import traceback
-        print(f"[API] ERROR creating learning path:")
-        print(traceback.format_exc())
+        logger.exception("Error creating learning path")
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Error creating learning path: {str(e)}")
 
@@ -205,52 +216,8 @@ async def create_learning_path_stream(
             result_container["data"] = learning_path_data
 
             # Save to database
-            learning_path = LearningPath(
-                user_id=demo_user.id,
-                topic=topic,
-                proficiency_level=learning_path_data["user_profile"]["proficiency_level"],
-                commitment_level=learning_path_data["user_profile"]["commitment_level"],
-                curriculum=json.dumps(learning_path_data["curriculum"]),
-                schedule=json.dumps(learning_path_data["schedule"]),
-                status="active"
-            )
-
-            db.add(learning_path)
-            db.commit()
-            db.refresh(learning_path)
-
-            # Create study sessions
-            for session_data in learning_path_data["schedule"]:
-                scheduled_time = datetime.fromisoformat(session_data["scheduled_time"])
-                session = StudySession(
-                    learning_path_id=learning_path.id,
-                    module_id=session_data["module_id"],
-                    module_title=session_data["module_title"],
-                    session_topic=session_data.get("session_topic"),
-                    description=session_data.get("session_description") or session_data.get("description"),
-                    learning_objectives=json.dumps(session_data.get("learning_objectives", [])),
-                    scheduled_time=scheduled_time,
-                    duration_minutes=session_data["duration_minutes"],
-                    resources=json.dumps(session_data.get("resources", [])),
-                    session_number=session_data.get("session_number")
-                )
-                db.add(session)
-
-            # Create assessments
-            for assessment_data in learning_path_data["assessments"]:
-                try:
-                    assessment = Assessment(
-                        learning_path_id=learning_path.id,
-                        module_id=assessment_data["module_id"],
-                        assessment_type=assessment_data["assessment_type"],
-                        questions=json.dumps(assessment_data["questions"])
-                    )
-                    db.add(assessment)
-                except Exception as e:
-                    print(f"Warning: Failed to create assessment: {e}")
-
-            db.commit()
-            print(f"[API] SSE: Successfully saved learning path {learning_path.id}")
+            learning_path = _save_learning_path(db, demo_user.id, topic, learning_path_data)
+            logger.info("SSE: Successfully saved learning path %s", learning_path.id)
 
             # Emit completion
             await tracker.emit_complete(
@@ -259,8 +226,7 @@ async def create_learning_path_stream(
             )
 
         except Exception as e:
-            import traceback
-            print(f"[API] SSE ERROR: {traceback.format_exc()}")
+            logger.exception("SSE learning path creation failed")
             db.rollback()
             result_container["error"] = str(e)
             await tracker.emit_error(f"Error creating learning path: {str(e)}")
@@ -273,7 +239,7 @@ async def create_learning_path_stream(
         try:
             # Stream events from tracker
             async for event in tracker.stream():
-                yield f"data: {json.dumps(event.to_dict())}\n\n"
+                yield f"data: {_dumps(event.to_dict())}\n\n"
 
                 # Stop on completion or error
                 if event.type in ("complete", "error"):
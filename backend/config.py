@@ -30,9 +30,15 @@ class Settings(BaseSettings):
     anthropic_api_key: str = ""
     openai_api_key: str = ""
 
+    # How long identical LLM responses are reused, in seconds (0 disables caching)
+    llm_cache_ttl: int = 86400
+
     # YouTube Data API
     youtube_api_key: str = ""
 
+    # How long video/article search results are reused, in seconds (0 disables caching)
+    resource_cache_ttl: int = 3600
+
     class Config:
         # Look for .env in backend directory
         env_file = os.path.join(Path(__file__).parent, ".env")
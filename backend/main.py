@@ -1,10 +1,18 @@
 """FastAPI main application for StudySync backend."""
 
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from backend.database import init_db
+from backend.logging_config import configure_logging
+from backend.services.llm_service import close_http_client
+from backend.agents.tools import close_browse_client
 from backend.api import auth, learning_paths, schedule, assessments
 
+configure_logging()
+logger = logging.getLogger(__name__)
+
 # Create FastAPI app
 app = FastAPI(
     title="StudySync API",
@@ -26,7 +34,14 @@ app.add_middleware(
 async def startup_event():
     """Initialize database tables on startup."""
     init_db()
-    print("Database initialized!")
+    logger.info("Database initialized!")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled HTTP connections on shutdown."""
+    close_http_client()
+    close_browse_client()
 
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
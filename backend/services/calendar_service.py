@@ -1,11 +1,21 @@
 """Google Calendar integration service."""
 
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from typing import List, Dict, Optional, Tuple
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _to_naive_utc(dt: datetime) -> datetime:
+    """Convert a datetime to naive UTC (naive datetimes are taken as local time)."""
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
 
 
 class CalendarService:
@@ -33,19 +43,11 @@ class CalendarService:
         time_max = now.isoformat() + "Z"
 
         try:
-            events_result = self.service.events().list(
-                calendarId="primary",
-                timeMin=time_min,
-                timeMax=time_max,
-                singleEvents=True,
-                orderBy="startTime"
-            ).execute()
-
-            events = events_result.get("items", [])
+            events = self._query_busy(time_min, time_max)
 
             # Analyze patterns
             busy_hours = self._analyze_busy_hours(events)
-            weekly_free_hours = self._calculate_weekly_free_hours(events)
+            weekly_free_hours = self._calculate_weekly_free_hours(events, days_back)
 
             return {
                 "busy_hours": busy_hours,
@@ -54,9 +56,28 @@ class CalendarService:
             }
 
         except HttpError as error:
-            print(f"An error occurred: {error}")
+            logger.error("Calendar API error: %s", error)
             return {"error": str(error)}
 
+    def _query_busy(self, time_min: str, time_max: str) -> List[Dict]:
+        """Fetch busy periods on the primary calendar in a single freebusy.query call.
+
+        Unlike events.list this is never paginated and only returns the
+        intervals. Intervals are shaped like events ({"start": {"dateTime"},
+        "end": {"dateTime"}}) so the analysis helpers accept either.
+        """
+        result = self.service.freebusy().query(body={
+            "timeMin": time_min,
+            "timeMax": time_max,
+            "items": [{"id": "primary"}],
+        }).execute()
+
+        busy = result.get("calendars", {}).get("primary", {}).get("busy", [])
+        return [
+            {"start": {"dateTime": period["start"]}, "end": {"dateTime": period["end"]}}
+            for period in busy
+        ]
+
     def _analyze_busy_hours(self, events: List[Dict]) -> Dict[str, List[int]]:
         """Identify which hours are typically busy each day."""
         # Simple heuristic: count events by hour and day of week
@@ -74,7 +95,7 @@ class CalendarService:
 
         return busy_by_day
 
-    def _calculate_weekly_free_hours(self, events: List[Dict]) -> float:
+    def _calculate_weekly_free_hours(self, events: List[Dict], days_analyzed: int = 14) -> float:
         """Estimate average weekly free hours (9am-9pm work hours)."""
         # Simplified: assume 12 hours available per day (9am-9pm)
         # Subtract average daily meeting hours
@@ -92,66 +113,86 @@ class CalendarService:
                 duration = (end_dt - start_dt).total_seconds() / 3600
                 total_busy_hours += duration
 
-        days_analyzed = 14
         avg_busy_per_day = total_busy_hours / days_analyzed
         avg_free_per_day = max(0, 12 - avg_busy_per_day)  # 12 hours available per day
         weekly_free = avg_free_per_day * 7
 
         return round(weekly_free, 1)
 
-    def find_free_slots(self, start_date: datetime, num_sessions: int, session_duration_minutes: int) -> List[Dict]:
+    def find_free_slots(
+        self,
+        start_date: datetime,
+        num_sessions: int,
+        session_duration_minutes: int,
+        sessions_per_week: int = 5,
+        preferred_hour: int = 18,
+        skip_weekends: bool = True
+    ) -> List[Dict]:
         """
         Find free slots for scheduling sessions.
-        Simple implementation: find gaps between 9am-9pm.
+
+        Checks one slot per day at preferred_hour and takes free ones in date
+        order, at most sessions_per_week per calendar week (Monday-Sunday),
+        the same pacing generate_time_slots uses.
         """
         slots = []
         current_date = start_date
+        sessions_per_week = max(1, sessions_per_week)
+        last_weekday = 4 if skip_weekends else 6
 
-        # Get events for next 60 days
-        time_min = current_date.isoformat() + "Z"
-        time_max = (current_date + timedelta(days=60)).isoformat() + "Z"
+        # Look far enough ahead for the requested pace, with room for busy days
+        weeks_needed = -(-num_sessions // sessions_per_week)
+        search_end = current_date + timedelta(days=max(60, (weeks_needed + 2) * 7))
 
-        try:
-            events_result = self.service.events().list(
-                calendarId="primary",
-                timeMin=time_min,
-                timeMax=time_max,
-                singleEvents=True,
-                orderBy="startTime"
-            ).execute()
+        time_min = current_date.astimezone(timezone.utc).isoformat()
+        time_max = search_end.astimezone(timezone.utc).isoformat()
 
-            events = events_result.get("items", [])
+        try:
+            busy_index = self._busy_index(self._query_busy(time_min, time_max))
 
-            # Simple slot finding: look for free slots between 9am-9pm
             search_date = current_date
-            while len(slots) < num_sessions and search_date < current_date + timedelta(days=60):
-                # Skip weekends for POC
-                if search_date.weekday() >= 5:
-                    search_date += timedelta(days=1)
+            week_start = None
+            sessions_this_week = 0
+            while len(slots) < num_sessions and search_date < search_end:
+                weekday = search_date.weekday()
+                monday = search_date.date() - timedelta(days=weekday)
+                if monday != week_start:
+                    week_start = monday
+                    sessions_this_week = 0
+
+                # Move on to next Monday once this week is full or out of usable days
+                if sessions_this_week >= sessions_per_week or weekday > last_weekday:
+                    search_date += timedelta(days=7 - weekday)
                     continue
 
-                # Check 6pm-8pm slot (good for working professionals)
-                slot_start = search_date.replace(hour=18, minute=0, second=0, microsecond=0)
+                slot_start = search_date.replace(hour=preferred_hour, minute=0, second=0, microsecond=0)
                 slot_end = slot_start + timedelta(minutes=session_duration_minutes)
 
-                # Check if slot is free
-                if self._is_slot_free(slot_start, slot_end, events):
+                # Check if slot is free (busy periods are naive UTC, slots local time)
+                if self._is_slot_free(_to_naive_utc(slot_start), _to_naive_utc(slot_end), busy_index):
                     slots.append({
                         "start": slot_start.isoformat(),
                         "end": slot_end.isoformat(),
                         "duration_minutes": session_duration_minutes
                     })
+                    sessions_this_week += 1
 
                 search_date += timedelta(days=1)
 
             return slots
 
         except HttpError as error:
-            print(f"An error occurred: {error}")
+            logger.error("Calendar API error: %s", error)
             return []
 
-    def _is_slot_free(self, slot_start: datetime, slot_end: datetime, events: List[Dict]) -> bool:
-        """Check if a time slot is free."""
+    def _busy_index(self, events: List[Dict]) -> Tuple[List[datetime], List[datetime]]:
+        """Index busy periods for _is_slot_free.
+
+        Returns the period starts in ascending order, plus the latest end
+        among the periods up to each position. Times are naive UTC, so slots
+        must be converted with _to_naive_utc before comparing (see find_free_slots).
+        """
+        periods = []
         for event in events:
             event_start = event.get("start", {}).get("dateTime")
             event_end = event.get("end", {}).get("dateTime")
@@ -159,14 +200,29 @@ class CalendarService:
             if not event_start or not event_end:
                 continue
 
-            event_start_dt = datetime.fromisoformat(event_start.replace("Z", "+00:00"))
-            event_end_dt = datetime.fromisoformat(event_end.replace("Z", "+00:00"))
-
-            # Check for overlap
-            if slot_start < event_end_dt and slot_end > event_start_dt:
-                return False
-
-        return True
+            periods.append((
+                _to_naive_utc(datetime.fromisoformat(event_start.replace("Z", "+00:00"))),
+                _to_naive_utc(datetime.fromisoformat(event_end.replace("Z", "+00:00")))
+            ))
+
+        periods.sort()
+        starts = [start for start, _ in periods]
+        latest_ends = list(accumulate((end for _, end in periods), max))
+        return starts, latest_ends
+
+    def _is_slot_free(
+        self,
+        slot_start: datetime,
+        slot_end: datetime,
+        busy_index: Tuple[List[datetime], List[datetime]]
+    ) -> bool:
+        """Check if a time slot is free, given a _busy_index."""
+        starts, latest_ends = busy_index
+
+        # Only periods starting before the slot ends can overlap it, and one
+        # does if the latest of their ends is after the slot starts
+        overlapping_candidates = bisect_left(starts, slot_end)
+        return overlapping_candidates == 0 or latest_ends[overlapping_candidates - 1] <= slot_start
 
     def create_event(self, summary: str, start_time: datetime, duration_minutes: int, description: str = "") -> Dict:
         """Create a calendar event."""
@@ -1,12 +1,50 @@
 """LLM service using OpenAI GPT-4.1."""
 
-from openai import OpenAI
+from openai import OpenAI, DefaultHttpxClient
 from backend.config import get_settings
+from backend.services.response_cache import TTLCache, make_cache_key
 from typing import List, Dict, Optional
+import httpx
 import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+# Shared by all LLMService instances: identical requests reuse the earlier response
+_response_cache = TTLCache(maxsize=2048, ttl=settings.llm_cache_ttl)
+
+# Shared by all LLMService instances so connections (TCP + TLS) are reused across calls
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Get the process-wide pooled HTTP client used for OpenAI requests."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = DefaultHttpxClient(
+                limits=httpx.Limits(max_connections=128, max_keepalive_connections=64)
+            )
+        return _http_client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP connection pool (call on application shutdown)."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+
+def subtopic_titles(subtopics: List) -> List[str]:
+    """Get subtopic names from a module's subtopics (dicts with 'title' or plain strings)."""
+    return [s.get("title", "") if isinstance(s, dict) else str(s) for s in subtopics]
+
 
 class LLMService:
     """Service for interacting with OpenAI API."""
@@ -17,14 +55,14 @@ class LLMService:
         if not api_key or api_key == "":
             raise ValueError(f"OPENAI_API_KEY is empty or not set! Check backend/.env file")
 
-        print(f"[LLMService] Initializing with OpenAI API key: {api_key[:20]}...")
+        logger.info("Initializing OpenAI client")
 
         try:
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(api_key=api_key, http_client=_get_http_client())
             self.model = "gpt-4.1"
-            print(f"[LLMService] Successfully initialized OpenAI client with model: {self.model}")
+            logger.info("Successfully initialized OpenAI client with model: %s", self.model)
         except Exception as e:
-            print(f"[LLMService] ERROR initializing OpenAI client: {e}")
+            logger.error("Failed to initialize OpenAI client: %s", e)
             raise
 
     def _call_llm(self, prompt: str, max_tokens: int = 2000) -> str:
@@ -46,6 +84,12 @@ class LLMService:
 
     def analyze_topic_scope(self, topic: str, proficiency_level: str) -> Dict:
         """Analyze a topic to determine its scope and key learning areas."""
+        cache_key = make_cache_key("topic_scope", self.model, topic, proficiency_level)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached topic scope for: %s", topic)
+            return cached
+
         prompt = f"""Analyze the learning topic: {topic}
 
 For a {proficiency_level} learner, provide:
@@ -71,10 +115,11 @@ Be practical and focus on what's actually needed for a {proficiency_level} learn
             content = self._call_llm(prompt, max_tokens=800)
             content = self._extract_json(content)
             result = json.loads(content)
-            print(f"[LLMService] Analyzed topic scope: {len(result.get('key_areas', []))} key areas")
+            logger.info("Analyzed topic scope: %s key areas", len(result.get('key_areas', [])))
+            _response_cache.set(cache_key, result)
             return result
         except Exception as e:
-            print(f"Error analyzing topic scope: {e}")
+            logger.error("Error analyzing topic scope: %s", e)
             return {
                 "topic": topic,
                 "scope": f"Introduction to {topic}",
@@ -86,6 +131,14 @@ Be practical and focus on what's actually needed for a {proficiency_level} learn
 
     def generate_module_outline(self, topic: str, module_title: str, proficiency_level: str, module_number: int, total_modules: int) -> Dict:
         """Generate a detailed outline for a single curriculum module."""
+        cache_key = make_cache_key(
+            "module_outline", self.model, topic, module_title, proficiency_level, module_number, total_modules
+        )
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached module outline for: %s", module_title)
+            return cached
+
         prompt = f"""Create a detailed module outline for:
 
 Main Topic: {topic}
@@ -121,10 +174,11 @@ Make it practical and appropriate for a {proficiency_level} learner."""
             content = self._call_llm(prompt, max_tokens=1000)
             content = self._extract_json(content)
             result = json.loads(content)
-            print(f"[LLMService] Generated module outline: {module_title} with {len(result.get('subtopics', []))} subtopics")
+            logger.info("Generated module outline: %s with %s subtopics", module_title, len(result.get('subtopics', [])))
+            _response_cache.set(cache_key, result)
             return result
         except Exception as e:
-            print(f"Error generating module outline: {e}")
+            logger.error("Error generating module outline: %s", e)
             return {
                 "module_id": f"m{module_number}",
                 "title": module_title,
@@ -140,6 +194,11 @@ Make it practical and appropriate for a {proficiency_level} learner."""
 
     def generate_curriculum(self, topic: str, proficiency_level: str, commitment_level: str, duration_weeks: Optional[float] = None) -> Dict:
         """Generate a learning curriculum for the given topic."""
+        cache_key = make_cache_key("curriculum", self.model, topic, proficiency_level, commitment_level, duration_weeks)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached curriculum for: %s", topic)
+            return cached
 
         duration_context = ""
         if duration_weeks:
@@ -191,26 +250,30 @@ Keep it practical and focused on the essentials for a {proficiency_level} learne
 
         try:
             content = self._call_llm(prompt, max_tokens=2000)
-            print(f"[LLMService] Raw curriculum response length: {len(content)}")
+            logger.debug("Raw curriculum response length: %s", len(content))
 
             content = self._extract_json(content)
             curriculum = json.loads(content)
-            print(f"[LLMService] Successfully parsed curriculum with {len(curriculum.get('modules', []))} modules")
+            logger.info("Successfully parsed curriculum with %s modules", len(curriculum.get('modules', [])))
+            _response_cache.set(cache_key, curriculum)
             return curriculum
 
         except Exception as e:
-            print(f"Error generating curriculum: {e}")
-            print(f"Raw content: {content[:200] if 'content' in locals() else 'N/A'}...")
+            logger.error("Error generating curriculum: %s", e)
+            logger.debug("Raw content: %s...", content[:200] if 'content' in locals() else 'N/A')
             return self._fallback_curriculum(topic)
 
     def get_resources_for_module(self, module_title: str, subtopics: List[str]) -> List[Dict]:
         """Generate specific, high-quality learning resources for a module."""
-        subtopic_names = []
-        for s in subtopics:
-            if isinstance(s, dict):
-                subtopic_names.append(s.get("title", ""))
-            else:
-                subtopic_names.append(str(s))
+        subtopic_names = subtopic_titles(subtopics)
+
+        # Subtopic order doesn't change which resources fit, so modules that
+        # share the same subtopics reuse one lookup
+        cache_key = make_cache_key("module_resources", self.model, module_title, sorted(subtopic_names))
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached resources for: %s", module_title)
+            return cached
 
         prompt = f"""Find 3-5 specific, high-quality learning resources for:
 
@@ -242,21 +305,23 @@ IMPORTANT:
             content = self._call_llm(prompt, max_tokens=1000)
             content = self._extract_json(content)
             resources = json.loads(content)
-            print(f"[LLMService] Successfully generated {len(resources)} resources")
+            logger.info("Successfully generated %s resources", len(resources))
+            _response_cache.set(cache_key, resources)
             return resources
 
         except Exception as e:
-            print(f"Error generating resources: {e}")
+            logger.error("Error generating resources: %s", e)
             return []
 
     def generate_quiz(self, module_title: str, subtopics: List[str], num_questions: int = 5) -> List[Dict]:
         """Generate quiz questions for a module."""
-        subtopic_names = []
-        for s in subtopics:
-            if isinstance(s, dict):
-                subtopic_names.append(s.get("title", ""))
-            else:
-                subtopic_names.append(str(s))
+        subtopic_names = subtopic_titles(subtopics)
+
+        cache_key = make_cache_key("quiz", self.model, module_title, subtopic_names, num_questions)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached quiz for: %s", module_title)
+            return cached
 
         prompt = f"""Create {num_questions} multiple-choice quiz questions for a learning module.
 
@@ -298,20 +363,118 @@ Make questions practical and test understanding, not just memorization."""
 
             try:
                 questions = json.loads(content)
-                print(f"[LLMService] Successfully generated {len(questions)} quiz questions")
+                logger.info("Successfully generated %s quiz questions", len(questions))
+                _response_cache.set(cache_key, questions)
                 return questions
             except json.JSONDecodeError as json_err:
-                print(f"JSON decode error: {json_err}")
-                print(f"Attempting to fix malformed JSON...")
+                logger.warning("JSON decode error: %s", json_err)
+                logger.info("Attempting to fix malformed JSON...")
                 return self._fallback_quiz()
 
         except Exception as e:
-            print(f"Error generating quiz: {e}")
-            print(f"Raw content: {content[:200] if 'content' in locals() else 'N/A'}...")
+            logger.error("Error generating quiz: %s", e)
+            logger.debug("Raw content: %s...", content[:200] if 'content' in locals() else 'N/A')
             return self._fallback_quiz()
 
+    def generate_quizzes_batch(self, modules: List[Dict], num_questions: int = 5) -> Optional[List[List[Dict]]]:
+        """Generate quiz questions for several modules with a single LLM call.
+
+        Args:
+            modules: List of dicts with 'title' and 'subtopics' keys
+            num_questions: Number of questions per module
+
+        Returns:
+            One list of questions per module, in the same order as modules,
+            or None if the batched response could not be parsed (callers
+            should then fall back to generate_quiz per module).
+        """
+        results: List[Optional[List[Dict]]] = [None] * len(modules)
+        pending = []
+
+        # Modules answered before (batched or not) are served from the cache
+        for i, module in enumerate(modules):
+            subtopic_names = subtopic_titles(module.get("subtopics", []))
+
+            cache_key = make_cache_key("quiz", self.model, module.get("title", ""), subtopic_names, num_questions)
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append((i, module.get("title", ""), subtopic_names, cache_key))
+
+        if not pending:
+            logger.info("Using cached quizzes for all %s modules", len(modules))
+            return results
+
+        module_list = "\n".join(
+            f"{n}. Module: {title}\n   Topics covered: {', '.join(subtopic_names)}"
+            for n, (_, title, subtopic_names, _) in enumerate(pending, start=1)
+        )
+
+        prompt = f"""Create {num_questions} multiple-choice quiz questions for EACH of the following {len(pending)} learning modules.
+
+{module_list}
+
+IMPORTANT:
+- Do NOT include code snippets in questions (they break JSON parsing)
+- Keep questions conceptual and text-based only
+- Use simple, clear language
+- Avoid special characters like quotes and backslashes in questions
+
+For each question, provide:
+- The question text (NO code snippets)
+- 4 answer options (A, B, C, D)
+- The correct answer (letter)
+- A brief explanation
+
+Format as a valid JSON array with exactly {len(pending)} elements, one per module in the order listed above.
+Each element is the array of questions for that module:
+[
+  [
+    {{
+      "question": "What is the primary characteristic of this concept?",
+      "options": {{
+        "A": "Option A",
+        "B": "Option B",
+        "C": "Option C",
+        "D": "Option D"
+      }},
+      "correct_answer": "B",
+      "explanation": "Brief explanation why B is correct"
+    }}
+  ]
+]
+
+Make questions practical and test understanding, not just memorization."""
+
+        try:
+            content = self._call_llm(prompt, max_tokens=1500 * len(pending))
+            content = self._extract_json(content)
+            batched = json.loads(content)
+        except Exception as e:
+            logger.error("Error generating batched quizzes: %s", e)
+            return None
+
+        if not isinstance(batched, list) or len(batched) != len(pending) \
+                or not all(isinstance(questions, list) and questions for questions in batched):
+            logger.warning("Batched quiz response did not match %s modules", len(pending))
+            return None
+
+        for (i, _, _, cache_key), questions in zip(pending, batched):
+            _response_cache.set(cache_key, questions)
+            results[i] = questions
+
+        logger.info("Successfully generated quizzes for %s modules in one request", len(pending))
+        return results
+
     def generate_proficiency_questions(self, topic: str) -> List[Dict]:
         """Generate adaptive proficiency assessment questions."""
+        cache_key = make_cache_key("proficiency", self.model, topic)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached proficiency questions for: %s", topic)
+            return cached
+
         prompt = f"""Create 5 proficiency assessment questions for the topic: {topic}
 
 These questions should help determine if the learner is a beginner, intermediate, or advanced.
@@ -333,22 +496,24 @@ Make questions practical and assess real understanding."""
             content = self._call_llm(prompt, max_tokens=1200)
             content = self._extract_json(content)
             questions = json.loads(content)
-            print(f"[LLMService] Successfully generated {len(questions)} proficiency questions")
+            logger.info("Successfully generated %s proficiency questions", len(questions))
+            _response_cache.set(cache_key, questions)
             return questions
 
         except Exception as e:
-            print(f"Error generating proficiency questions: {e}")
-            print(f"Raw content: {content[:200] if 'content' in locals() else 'N/A'}...")
+            logger.error("Error generating proficiency questions: %s", e)
+            logger.debug("Raw content: %s...", content[:200] if 'content' in locals() else 'N/A')
             return self._fallback_proficiency_questions(topic)
 
     def generate_study_guide(self, module_title: str, subtopics: List[str]) -> str:
         """Generate a markdown study guide for a module."""
-        subtopic_names = []
-        for s in subtopics:
-            if isinstance(s, dict):
-                subtopic_names.append(s.get("title", ""))
-            else:
-                subtopic_names.append(str(s))
+        subtopic_names = subtopic_titles(subtopics)
+
+        cache_key = make_cache_key("study_guide", self.model, module_title, subtopic_names)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached study guide for: %s", module_title)
+            return cached
 
         prompt = f"""Create a concise study guide for:
 
@@ -365,10 +530,11 @@ Keep it under 500 words and actionable."""
 
         try:
             content = self._call_llm(prompt, max_tokens=1000)
+            _response_cache.set(cache_key, content)
             return content
 
         except Exception as e:
-            print(f"Error generating study guide: {e}")
+            logger.error("Error generating study guide: %s", e)
             return f"# {module_title}\n\nStudy guide generation failed. Please refer to module resources."
 
     def _fallback_curriculum(self, topic: str) -> Dict:
@@ -414,3 +580,23 @@ Keep it under 500 words and actionable."""
                 "difficulty": "beginner"
             }
         ]
+
+
+_service_instance: Optional[LLMService] = None
+_service_lock = threading.Lock()
+
+
+def get_llm_service() -> LLMService:
+    """Get the singleton LLM service instance.
+
+    Safe to call from worker threads. If initialization fails (e.g. no API
+    key) the error propagates and the next call tries again.
+
+    Returns:
+        LLMService instance
+    """
+    global _service_instance
+    with _service_lock:
+        if _service_instance is None:
+            _service_instance = LLMService()
+        return _service_instance
@@ -4,10 +4,59 @@ Uses pytubefix and ddgs to find actual URLs without requiring API keys.
 """
 
 from typing import Dict, List, Optional
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urlparse
+from functools import lru_cache
+import logging
+import threading
+
+from backend.config import get_settings
+from backend.services.response_cache import TTLCache, make_cache_key
+
+logger = logging.getLogger(__name__)
 
 # Singleton instance
 _service_instance = None
+_service_lock = threading.Lock()
+
+# Search results shared by all sessions and learning paths
+_search_cache = TTLCache(maxsize=1024, ttl=get_settings().resource_cache_ttl)
+
+
+# Title keywords used by the quality scorers (matched as substrings of the lowercased title)
+_VIDEO_EDUCATIONAL_KEYWORDS = ("tutorial", "explained", "learn", "beginner", "guide", "how to", "introduction")
+_VIDEO_CLICKBAIT_KEYWORDS = ("shocking", "won't believe", "gone wrong", "funny")
+_ARTICLE_EDUCATIONAL_KEYWORDS = ("tutorial", "guide", "learn", "introduction", "explained")
+
+# Domains to exclude from article results (not useful for learning guides, or already covered by video search)
+_EXCLUDED_SOURCES = ("wikipedia.org", "youtube.com", "youtu.be")
+
+_TRUSTED_SOURCES = frozenset({
+    "freecodecamp.org", "dev.to", "medium.com", "realpython.com",
+    "digitalocean.com", "geeksforgeeks.org", "developer.mozilla.org",
+    "docs.python.org", "w3schools.com"
+})
+
+
+def _is_trusted_source(source: str) -> bool:
+    """Check whether a domain, or any parent domain of it, is a trusted source."""
+    parts = source.split(".")
+    return any(".".join(parts[i:]) in _TRUSTED_SOURCES for i in range(len(parts) - 1))
+
+
+@lru_cache(maxsize=512)
+def _encode_query(query: str) -> str:
+    """URL-encode a search query (memoized, fallbacks repeat the same topics)."""
+    return quote_plus(query)
+
+
+def clear_search_cache() -> None:
+    """Drop all cached video and article search results."""
+    _search_cache.clear()
+
+
+def _search_cache_key(kind: str, query: str, max_results: int) -> str:
+    """Build a cache key, normalizing case and whitespace in the query."""
+    return make_cache_key(kind, " ".join(query.lower().split()), max_results)
 
 
 class ResourceDiscoveryService:
@@ -18,15 +67,17 @@ class ResourceDiscoveryService:
         self._pytubefix_search = None
         self._ddg_search = None
         self._llm_service = None
+        # DDGS clients are not thread-safe, so each worker thread keeps its own
+        self._ddgs_local = threading.local()
 
     def _get_llm_service(self):
         """Lazy load LLM service for relevance checking."""
         if self._llm_service is None:
             try:
-                from backend.services.llm_service import LLMService
-                self._llm_service = LLMService()
+                from backend.services.llm_service import get_llm_service
+                self._llm_service = get_llm_service()
             except Exception as e:
-                print(f"[ResourceDiscoveryService] Could not load LLM service: {e}")
+                logger.warning("Could not load LLM service: %s", e)
                 self._llm_service = False
         return self._llm_service
 
@@ -37,7 +88,7 @@ class ResourceDiscoveryService:
                 from pytubefix import Search
                 self._pytubefix_search = Search
             except ImportError:
-                print("[ResourceDiscoveryService] pytubefix not installed")
+                logger.warning("pytubefix not installed")
                 self._pytubefix_search = False
         return self._pytubefix_search
 
@@ -48,10 +99,22 @@ class ResourceDiscoveryService:
                 from ddgs import DDGS
                 self._ddg_search = DDGS
             except ImportError:
-                print("[ResourceDiscoveryService] ddgs not installed")
+                logger.warning("ddgs not installed")
                 self._ddg_search = False
         return self._ddg_search
 
+    def _get_ddgs_client(self):
+        """Get this thread's DDGS client, reused so its HTTP connections stay open."""
+        DDGS = self._get_ddg_search()
+        if not DDGS:
+            return None
+
+        client = getattr(self._ddgs_local, "client", None)
+        if client is None:
+            client = DDGS()
+            self._ddgs_local.client = client
+        return client
+
     def search_youtube_videos(self, query: str, max_results: int = 5) -> List[Dict]:
         """Search YouTube for videos matching the query.
 
@@ -70,6 +133,11 @@ class ResourceDiscoveryService:
             - thumbnail: Thumbnail URL
             - platform: "youtube"
         """
+        cache_key = _search_cache_key("youtube", query, max_results)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         Search = self._get_youtube_search()
 
         if not Search:
@@ -82,23 +150,27 @@ class ResourceDiscoveryService:
 
             videos = []
             for yt in results:
+                # pytubefix attributes are computed properties - read each one once
+                length = yt.length
+                views = yt.views
                 video = {
                     "type": "video",
                     "title": yt.title or "",
                     "url": yt.watch_url or "",
-                    "duration": str(yt.length) if yt.length else "",
+                    "duration": str(length) if length else "",
                     "channel": yt.author or "",
-                    "views": str(yt.views) if yt.views else "",
+                    "views": str(views) if views else "",
                     "thumbnail": yt.thumbnail_url or "",
                     "platform": "youtube"
                 }
                 videos.append(video)
 
-            print(f"[ResourceDiscoveryService] Found {len(videos)} YouTube videos for: {query}")
+            logger.info("Found %d YouTube videos for: %s", len(videos), query)
+            _search_cache.set(cache_key, videos)
             return videos
 
         except Exception as e:
-            print(f"[ResourceDiscoveryService] YouTube search error: {e}")
+            logger.warning("YouTube search error: %s", e)
             return self._fallback_youtube_results(query, max_results)
 
     def search_articles(self, query: str, max_results: int = 5) -> List[Dict]:
@@ -117,49 +189,54 @@ class ResourceDiscoveryService:
             - source: Domain name
             - platform: "web"
         """
-        DDGS = self._get_ddg_search()
-
-        if not DDGS:
-            return self._fallback_article_results(query, max_results)
+        cache_key = _search_cache_key("articles", query, max_results)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            ddgs = DDGS()
+            ddgs = self._get_ddgs_client()
+
+            if not ddgs:
+                return self._fallback_article_results(query, max_results)
+
             results = list(ddgs.text(query, max_results=max_results))
 
             articles = []
-            # Domains to exclude (not useful for learning guides, or already covered by video search)
-            excluded_domains = ["wikipedia.org", "en.wikipedia.org", "simple.wikipedia.org", "youtube.com", "youtu.be"]
 
             for item in results:
-                url = item.get("href", "")
-                # Extract domain for source
+                get = item.get
+                url = get("href", "")
+                # Extract domain for source (lowercased once here, so scorers can use it as is)
                 source = ""
                 if url:
                     try:
-                        from urllib.parse import urlparse
-                        source = urlparse(url).netloc.replace("www.", "")
+                        source = urlparse(url).netloc.lower().removeprefix("www.")
                     except Exception:
                         pass
 
                 # Skip excluded domains
-                if any(excluded in source for excluded in excluded_domains):
+                if any(excluded in source for excluded in _EXCLUDED_SOURCES):
                     continue
 
                 article = {
                     "type": "article",
-                    "title": item.get("title", ""),
+                    "title": get("title", ""),
                     "url": url,
-                    "description": item.get("body", ""),
+                    "description": get("body", ""),
                     "source": source,
                     "platform": "web"
                 }
                 articles.append(article)
 
-            print(f"[ResourceDiscoveryService] Found {len(articles)} articles for: {query}")
+            logger.info("Found %d articles for: %s", len(articles), query)
+            _search_cache.set(cache_key, articles)
             return articles
 
         except Exception as e:
-            print(f"[ResourceDiscoveryService] Article search error: {e}")
+            logger.warning("Article search error: %s", e)
+            # Drop this thread's client so the next search starts with a fresh one
+            self._ddgs_local.client = None
             return self._fallback_article_results(query, max_results)
 
     def check_resource_relevance(self, resource: Dict, session_topic: str, main_topic: str) -> bool:
@@ -197,10 +274,10 @@ Answer:"""
             response = llm._call_llm(prompt, max_tokens=10).strip().lower()
             is_relevant = response.startswith("yes")
             if not is_relevant:
-                print(f"[ResourceDiscoveryService] Filtered out irrelevant {resource_type}: {title[:50]}")
+                logger.debug("Filtered out irrelevant %s: %s", resource_type, title[:50])
             return is_relevant
         except Exception as e:
-            print(f"[ResourceDiscoveryService] Relevance check error: {e}")
+            logger.warning("Relevance check error: %s", e)
             return True  # Default to keeping resource on error
 
     def find_resources_for_topic(
@@ -265,16 +342,10 @@ Answer:"""
         title = video.get("title", "").lower()
 
         # Boost for educational keywords
-        educational_keywords = ["tutorial", "explained", "learn", "beginner", "guide", "how to", "introduction"]
-        for keyword in educational_keywords:
-            if keyword in title:
-                score += 0.1
+        score += 0.1 * sum(keyword in title for keyword in _VIDEO_EDUCATIONAL_KEYWORDS)
 
         # Penalize clickbait
-        clickbait_keywords = ["shocking", "won't believe", "gone wrong", "funny"]
-        for keyword in clickbait_keywords:
-            if keyword in title:
-                score -= 0.2
+        score -= 0.2 * sum(keyword in title for keyword in _VIDEO_CLICKBAIT_KEYWORDS)
 
         # Clamp to 0.0-1.0
         return max(0.0, min(1.0, score))
@@ -290,32 +361,22 @@ Answer:"""
         """
         score = 0.5  # Base score
 
-        source = article.get("source", "").lower()
+        source = article.get("source", "")
         title = article.get("title", "").lower()
 
         # Boost for trusted sources
-        trusted_sources = [
-            "freecodecamp.org", "dev.to", "medium.com", "realpython.com",
-            "digitalocean.com", "geeksforgeeks.org", "developer.mozilla.org",
-            "docs.python.org", "w3schools.com"
-        ]
-        for trusted in trusted_sources:
-            if trusted in source:
-                score += 0.3
-                break
+        if _is_trusted_source(source):
+            score += 0.3
 
         # Boost for educational keywords
-        educational_keywords = ["tutorial", "guide", "learn", "introduction", "explained"]
-        for keyword in educational_keywords:
-            if keyword in title:
-                score += 0.05
+        score += 0.05 * sum(keyword in title for keyword in _ARTICLE_EDUCATIONAL_KEYWORDS)
 
         # Clamp to 0.0-1.0
         return max(0.0, min(1.0, score))
 
     def _fallback_youtube_results(self, query: str, max_results: int) -> List[Dict]:
         """Generate fallback YouTube search URLs."""
-        encoded_query = quote_plus(query)
+        encoded_query = _encode_query(query)
         return [{
             "type": "video",
             "title": f"Search YouTube: {query}",
@@ -330,7 +391,7 @@ Answer:"""
 
     def _fallback_article_results(self, query: str, max_results: int) -> List[Dict]:
         """Generate fallback article search URLs."""
-        encoded_query = quote_plus(query)
+        encoded_query = _encode_query(query)
         return [{
             "type": "article",
             "title": f"Search: {query}",
@@ -345,10 +406,13 @@ Answer:"""
 def get_resource_discovery_service() -> ResourceDiscoveryService:
     """Get the singleton resource discovery service instance.
 
+    Safe to call from the worker threads that run resource searches.
+
     Returns:
         ResourceDiscoveryService instance
     """
     global _service_instance
-    if _service_instance is None:
-        _service_instance = ResourceDiscoveryService()
-    return _service_instance
+    with _service_lock:
+        if _service_instance is None:
+            _service_instance = ResourceDiscoveryService()
+        return _service_instance